@@ -3,27 +3,43 @@
 
 import os
 import time
+import asyncio
 from flask import Flask, request, redirect, url_for, send_from_directory, jsonify
 import sqlite3
-from datetime import datetime
+from datetime import datetime, timedelta
 from jinja2 import Template
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
+try:
+    import openpyxl
+except ImportError:  # .xlsx imports fall back to pandas.read_excel
+    openpyxl = None
+try:
+    from lxml import etree, html as lxml_html
+    from lxml.cssselect import CSSSelector
+except ImportError:  # fall back to BeautifulSoup for extraction
+    lxml_html = None
 from werkzeug.utils import secure_filename
 import json
-from concurrent.futures import ThreadPoolExecutor
+import gzip
+import hashlib
+import base64
+import uuid
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, Future, wait
 import random
+import threading
 import time
 from functools import wraps
-from urllib.parse import urljoin, quote_plus
+from urllib.parse import urljoin, urlparse, quote_plus
 import re
-from collections import Counter
+from collections import Counter, OrderedDict, deque
 import nltk
 from nltk.tokenize import word_tokenize
 from nltk.corpus import stopwords
 import spacy
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+import numpy as np
+from scipy import sparse
 import PyPDF2
 import docx
 from flask_cors import CORS
@@ -33,9 +49,60 @@ import pandas as pd
 # CONFIGURATION
 DB_PATH = 'jobs.db'
 UPLOAD_FOLDER = 'uploads'
+HTML_FIXTURES_DIR = 'fixtures/html'
+SKILL_CORPUS = 'fixtures/skills/corpus.json'  # texts and the skill phrases extracted from them
 ALLOWED_EXTENSIONS = {'pdf', 'doc', 'docx', 'txt'}
+# Bump when skill extraction changes, so cached resume and job skill profiles are recomputed
+SKILL_PROFILE_VERSION = 2
+# 'word' matches known skills as whole words; 'substring' keeps the old matching,
+# where a skill inside a word ('r' in 'react') or a phrase inside a skill counts
+SKILL_MATCH_MODE = os.environ.get('SKILL_MATCH_MODE', 'word')
+
+# spaCy, used only for ORG/PRODUCT entities
+SPACY_MODEL = 'en_core_web_sm'
+# Components named entity recognition does not need; ner has its own tok2vec layer
+SPACY_EXCLUDE = ['tok2vec', 'tagger', 'parser', 'attribute_ruler', 'lemmatizer', 'senter']
+SPACY_ENTITY_LABELS = {'ORG', 'PRODUCT'}
+
+# Match scoring
+SKILL_CONTEXT_WEIGHTS = {
+    'requirements': 1.5,  # Required skills are most important
+    'experience': 1.3,    # Experience is second most important
+    'responsibilities': 1.0  # Responsibilities are least important
+}
+SCORE_CHUNK_SIZE = 500  # jobs read and scored per batch
+NLP_BATCH_SIZE = 64  # texts per nlp.pipe batch
+NLP_PROCESSES = int(os.environ.get('NLP_PROCESSES', 1))  # nlp.pipe worker processes for batches
+
 ALLOWED_EXCEL_EXTENSIONS = {'xlsx', 'xls', 'csv'}
-PER_PAGE = 5
+DEFAULT_PAGE_SIZE = 5
+MAX_PAGE_SIZE = 100
+SNAPSHOT_TTL = 60 * 60  # seconds a search result snapshot can be paged through
+SEARCH_MAX_RESULTS = 1000  # top results kept in a snapshot; the total still counts every match
+SEARCH_CACHE_TTL = 5 * 60  # seconds search filter options and full match counts are reused
+SEARCH_CACHE_SIZE = 256    # filter option and match count entries kept
+FTS_WEIGHTS = (10.0, 5.0, 1.0)  # BM25 weights of title, company and description for sort_by=relevance
+# /api/search sort_by values and the indexed jobs columns they sort on
+SEARCH_SORT_COLUMNS = {
+    'date_posted': 'date_posted',
+    'title': 'title',
+    'company': 'company',
+    'location': 'location',
+    'match_score': 'match_value',
+}
+
+# SQLite connections
+DB_POOL_SIZE = 8              # idle connections kept for reuse, per process
+DB_CACHED_STATEMENTS = 256    # prepared statements kept per connection
+DB_PRAGMAS = {
+    'auto_vacuum': 'INCREMENTAL',  # takes effect on new databases; compact_jobs converts old ones
+    'journal_mode': 'WAL',    # readers no longer wait for the ingestion writer
+    'synchronous': 'NORMAL',  # safe with WAL; fsync at checkpoints only
+    'cache_size': -16000,     # page cache in KiB (negative) per connection
+    'mmap_size': 64 * 1024 * 1024,
+    'busy_timeout': 5000,     # ms a writer waits for the lock before failing
+    'analysis_limit': 400,    # rows ANALYZE samples per index
+}
 os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 
 # Scraping Configuration
@@ -46,6 +113,105 @@ USER_AGENTS = [
     'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.1.1 Safari/605.1.15'
 ]
 
+# Browser-like headers sent with every job board request
+BROWSER_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+    'Cache-Control': 'no-cache',
+    'Pragma': 'no-cache',
+    'Sec-Fetch-Dest': 'document',
+    'Sec-Fetch-Mode': 'navigate',
+    'Sec-Fetch-Site': 'none',
+    'Sec-Fetch-User': '?1',
+    'DNT': '1'
+}
+
+# Fetch engine limits
+SCRAPE_CONCURRENCY_PER_HOST = 3   # requests in flight per job board
+SCRAPE_POLITENESS_DELAY = (2, 4)  # seconds a slot waits after each request
+SCRAPE_REQUEST_BUDGET = 12        # max requests per scrape, warm-up included
+SCRAPE_TIMEOUT = 10
+LINKEDIN_PAGES = 10
+
+# Platform fan-out
+PLATFORM_DEADLINE = 60  # seconds /api/search waits for each platform
+SCRAPE_WORKERS = 6      # platform fetchers that may run at once, across searches
+
+# Scrape result cache
+SCRAPE_CACHE_TTL = 15 * 60  # seconds a platform's results for a query stay fresh
+SCRAPE_CACHE_SIZE = 256     # (platform, keyword, location) entries kept
+
+# Background ingestion
+INGEST_ENABLED = os.environ.get('INGEST_ENABLED', '1') == '1'  # run the scheduler inside the web app
+INGEST_WORKERS = int(os.environ.get('INGEST_WORKERS', 0))  # raised to at least one per platform
+INGEST_WORKER_MODE = os.environ.get('INGEST_WORKER_MODE', 'thread')  # 'thread' or 'process'
+INGEST_INTERVAL = 30 * 60  # seconds between refreshes of a watched query
+INGEST_POLL_INTERVAL = 5   # seconds between scheduler queue checks
+INGEST_LEASE = 10 * 60     # seconds a claimed query stays locked to one worker
+INGEST_WAIT_POLL = 0.5     # seconds between checks while a search waits for a first ingest
+WATCH_TTL = int(os.environ.get('WATCH_TTL', 3 * 24 * 60 * 60))  # seconds a query is refreshed after its last search
+
+# Retained jobs store
+JOBS_TTL = int(os.environ.get('JOBS_TTL', 14 * 24 * 60 * 60))  # seconds an unseen, unreferenced job is kept
+COMPACT_INTERVAL = 60 * 60  # seconds between compactions run by the ingestion scheduler
+COMPACT_BATCH = 1000        # expired jobs deleted per transaction
+VACUUM_PAGES = 2000         # free pages returned to the filesystem per compaction
+REMOTE_LOCATIONS = ['remote', 'work from home', 'anywhere']
+DETAILS_PLACEHOLDER = 'Click "Details" to view full description'
+DETAILS_ERROR = 'Error fetching job details. Please try again later.'
+
+# Detail prefetch
+PREFETCH_TOP_N = 10  # top results per search whose details are fetched ahead of time
+PREFETCH_WORKERS = 4
+
+# Job detail page cache
+DETAIL_CACHE_DIR = 'cache/details'
+DETAIL_CACHE_FRESH = 6 * 60 * 60             # seconds a cached page is used without revalidating
+DETAIL_CACHE_MAX_AGE = 7 * 24 * 60 * 60      # seconds before an entry is evicted
+DETAIL_CACHE_MAX_BYTES = 200 * 1024 * 1024   # compressed bodies kept on disk
+DETAIL_CACHE_EVICT_INTERVAL = 60             # seconds between eviction passes
+
+# HTTP session pool
+SESSION_POOL_CONNECTIONS = 4  # hosts with pooled connections per platform session
+SESSION_POOL_MAXSIZE = 10     # keep-alive connections kept per host
+SESSION_COOKIE_TTL = 30 * 60  # seconds warm-up cookies are reused before warming up again
+
+# HTTP transport: 'live', 'record' (live, saving every response) or 'replay'
+# (saved responses only, no network and no politeness delay)
+HTTP_TRANSPORT = os.environ.get('HTTP_TRANSPORT', 'live')
+HTTP_FIXTURES_DIR = os.environ.get('HTTP_FIXTURES_DIR', 'fixtures/http')
+REPLAY_LATENCY = float(os.environ.get('REPLAY_LATENCY', 0))        # mean seconds added to each replayed response
+REPLAY_ERROR_RATE = float(os.environ.get('REPLAY_ERROR_RATE', 0))  # share of replayed requests that fail
+REPLAY_SEED = int(os.environ.get('REPLAY_SEED', 0))                # seeds latency jitter and injected errors
+
+# Application tracker imports
+IMPORT_CHUNK_ROWS = 5000  # spreadsheet rows read and staged at a time
+IMPORT_HISTORY = 20       # finished imports whose progress can still be looked up
+# Spreadsheet headers and the applications columns they fill
+IMPORT_COLUMNS = {
+    'Company': 'company',
+    'Location': 'location',
+    'Referral': 'referral',
+    'Link': 'job_link',
+    'Status': 'status',
+    'Referral mail': 'referral_mail',
+}
+
+# Application tracker
+TRACKER_PAGE_SIZE = 50          # applications per /api/tracker page unless ?limit= says otherwise
+TRACKER_DEFAULT_STATUS = 'Applied'
+TRACKER_SORT_COLUMNS = {
+    'applied_at': 'a.applied_at',
+    'status': 'a.status',
+    'company': 'a.company',
+    'title': 'a.title',
+    'location': 'a.location',
+}
+
 # Add this near the top of the file, after the imports
 COMMON_LOCATIONS = [
     # North America
@@ -79,353 +245,732 @@ COMMON_LOCATIONS = [
 def get_random_user_agent():
     return random.choice(USER_AGENTS)
 
-def rate_limit(func):
-    @wraps(func)
-    def wrapper(*args, **kwargs):
-        # Add a random delay between 5-10 seconds
-        delay = random.uniform(5, 10)
-        print(f"\nWaiting {delay:.2f} seconds before next request...")
-        time.sleep(delay)
-        return func(*args, **kwargs)
-    return wrapper
-
 def get_location_options():
     return sorted(COMMON_LOCATIONS)
 
-@rate_limit
-def fetch_linkedin_jobs(keyword, location):
-    try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.9',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-            'Cache-Control': 'no-cache',
-            'Pragma': 'no-cache',
-            'Sec-Fetch-Dest': 'document',
-            'Sec-Fetch-Mode': 'navigate',
-            'Sec-Fetch-Site': 'none',
-            'Sec-Fetch-User': '?1',
-            'DNT': '1'
-        }
-        
-        jobs = []
-        # LinkedIn paginates with the 'start' parameter (0, 25, 50, ...)
-        for start in range(0, 250, 25):  # Fetch 10 pages (0, 25, ..., 225)
-            if location.lower() in ['remote', 'work from home', 'anywhere']:
-                search_url = f"https://www.linkedin.com/jobs/search/?keywords={quote_plus(keyword)}&location=Worldwide&f_WT=2&start={start}"
-            else:
-                search_url = f"https://www.linkedin.com/jobs/search/?keywords={quote_plus(keyword)}&location={quote_plus(location)}&start={start}"
-            print(f"\nFetching LinkedIn jobs from: {search_url}")
-            session = requests.Session()
-            try:
-                response = session.get('https://www.linkedin.com', headers=headers, timeout=10)
-                response.raise_for_status()
-                time.sleep(random.uniform(2, 4))
-            except Exception as e:
-                print(f"Warning: Could not access LinkedIn main page: {str(e)}")
-            response = session.get(search_url, headers=headers, timeout=10)
-            response.raise_for_status()
-            print(f"LinkedIn response status code: {response.status_code}")
-            print(f"LinkedIn response content type: {response.headers.get('content-type', 'unknown')}")
-            print(f"LinkedIn response length: {len(response.text)}")
-            soup = BeautifulSoup(response.text, 'html.parser')
-            job_cards = soup.select('.jobs-search__results-list li') or soup.select('.job-card-container')
-            print(f"Found {len(job_cards)} LinkedIn job cards on page starting at {start}")
-            for job_card in job_cards:
-                try:
-                    title_elem = (
-                        job_card.select_one('.base-search-card__title') or 
-                        job_card.select_one('.job-card-list__title') or
-                        job_card.select_one('.job-search-card__title')
-                    )
-                    company_elem = (
-                        job_card.select_one('.base-search-card__subtitle') or 
-                        job_card.select_one('.job-card-container__company-name') or
-                        job_card.select_one('.job-search-card__company-name')
-                    )
-                    location_elem = (
-                        job_card.select_one('.job-search-card__location') or 
-                        job_card.select_one('.job-card-container__metadata-item') or
-                        job_card.select_one('.job-search-card__location')
-                    )
-                    link_elem = (
-                        job_card.select_one('a.base-card__full-link') or 
-                        job_card.select_one('a.job-card-container__link') or
-                        job_card.select_one('a.job-search-card__link')
-                    )
-                    if not all([title_elem, company_elem, location_elem, link_elem]):
-                        continue
-                    job_location = location_elem.text.strip()
-                    job = {
-                        'title': title_elem.text.strip(),
-                        'company': company_elem.text.strip(),
-                        'company_info': '',
-                        'location': job_location,
-                        'url': link_elem['href'],
-                        'date_posted': datetime.now().strftime('%Y-%m-%d'),
-                        'platform': 'LinkedIn',
-                        'description': 'Click "Details" to view full description',
-                        'requirements': [],
-                        'match_score': 'N/A',
-                        'salary_min': '',
-                        'salary_max': '',
-                        'salary_currency': '',
-                        'benefits': []
-                    }
-                    jobs.append(job)
-                    print(f"Added LinkedIn job: {job['title']} at {job['company']}")
-                except Exception as e:
-                    print(f"Error parsing LinkedIn job card: {str(e)}")
-                    continue
-            # Add a short delay between page fetches to avoid being blocked
-            time.sleep(random.uniform(2, 4))
-        print(f"Found {len(jobs)} total LinkedIn jobs across all pages")
-        return jobs
-    except Exception as e:
-        print(f"Error fetching LinkedIn jobs: {str(e)}")
-        return []
+# RECORD/REPLAY TRANSPORT
+class RecordReplayAdapter(HTTPAdapter):
+    """Transport adapter that records responses to, or replays them from, a fixture store.
 
-@rate_limit
-def fetch_indeed_jobs(keyword, location):
-    try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.9',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-            'Cache-Control': 'no-cache',
-            'Pragma': 'no-cache',
-            'Sec-Fetch-Dest': 'document',
-            'Sec-Fetch-Mode': 'navigate',
-            'Sec-Fetch-Site': 'none',
-            'Sec-Fetch-User': '?1',
-            'DNT': '1'
+    Each response is kept in `fixtures_dir` as <sha256(method url)>.json with
+    its status, headers and base64 body; a fixture may name an HTML file
+    under HTML_FIXTURES_DIR in 'body_file' instead of embedding the body. In
+    'record' mode requests go to the network and every response is saved. In
+    'replay' mode nothing leaves the machine: each request waits `latency`
+    seconds (+/-50% jitter), fails with a ConnectionError at `error_rate`, and
+    URLs with no fixture get a 404.
+    """
+
+    def __init__(self, mode, fixtures_dir=HTTP_FIXTURES_DIR, latency=REPLAY_LATENCY,
+                 error_rate=REPLAY_ERROR_RATE, seed=REPLAY_SEED, **kwargs):
+        super().__init__(**kwargs)
+        self.mode = mode
+        self.fixtures_dir = fixtures_dir
+        self.latency = latency
+        self.error_rate = error_rate
+        self.seed = seed
+        self._sent = Counter()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def fixture_path(fixtures_dir, method, url):
+        key = hashlib.sha256(f"{method.upper()} {url}".encode()).hexdigest()
+        return os.path.join(fixtures_dir, key + '.json')
+
+    def send(self, request, **kwargs):
+        if self.mode == 'record':
+            response = super().send(request, **kwargs)
+            self._save(request, response)
+            return response
+        return self._replay(request)
+
+    def _save(self, request, response):
+        # The body is stored decoded, so drop the headers that describe its encoding
+        headers = {k: v for k, v in response.headers.items()
+                   if k.lower() not in ('content-encoding', 'content-length', 'transfer-encoding')}
+        fixture = {
+            'method': request.method,
+            'url': request.url,
+            'status': response.status_code,
+            'reason': response.reason,
+            'headers': headers,
+            'body': base64.b64encode(response.content).decode('ascii')
         }
+        path = self.fixture_path(self.fixtures_dir, request.method, request.url)
+        os.makedirs(self.fixtures_dir, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(fixture, f, indent=2)
+
+    def _replay(self, request):
+        # Seeded per request, so the same requests get the same delays and
+        # errors however the threads interleave
+        key = f"{request.method} {request.url}"
+        with self._lock:
+            self._sent[key] += 1
+            rng = random.Random(f"{self.seed}:{key}:{self._sent[key]}")
+        delay = self.latency * rng.uniform(0.5, 1.5)
+        fail = rng.random() < self.error_rate
+        if delay:
+            time.sleep(delay)
+        if fail:
+            raise requests.exceptions.ConnectionError(f"Injected replay error for {request.url}", request=request)
         
-        # Handle remote locations
-        if location.lower() in ['remote', 'work from home', 'anywhere']:
-            search_url = f"https://www.indeed.com/jobs?q={quote_plus(keyword)}&sc=0kf%3Aattr(FSFW)%3B"
-        else:
-            search_url = f"https://www.indeed.com/jobs?q={quote_plus(keyword)}&l={quote_plus(location)}"
-        
-        print(f"\nFetching Indeed jobs from: {search_url}")
-        session = requests.Session()
-        
-        # First make a GET request to the main page
+        path = self.fixture_path(self.fixtures_dir, request.method, request.url)
         try:
-            response = session.get('https://www.indeed.com', headers=headers, timeout=10)
-            response.raise_for_status()
-            time.sleep(random.uniform(2, 4))  # Wait before the next request
-        except Exception as e:
-            print(f"Warning: Could not access Indeed main page: {str(e)}")
-        
-        # Now fetch the search results
-        response = session.get(search_url, headers=headers, timeout=10)
-        response.raise_for_status()
-        
-        print(f"Indeed response status code: {response.status_code}")
-        print(f"Indeed response content type: {response.headers.get('content-type', 'unknown')}")
-        print(f"Indeed response length: {len(response.text)}")
-        
-        soup = BeautifulSoup(response.text, 'html.parser')
-        jobs = []
-        
-        # Try different selectors for job cards
-        job_cards = soup.select('.job_seen_beacon') or soup.select('.jobsearch-ResultsList > div')
-        print(f"Found {len(job_cards)} Indeed job cards")
+            with open(path, encoding='utf-8') as f:
+                fixture = json.load(f)
+        except FileNotFoundError:
+            fixture = {'status': 404, 'reason': 'Not Found', 'headers': {}, 'body': ''}
+        if 'body_file' in fixture:
+            with open(os.path.join(HTML_FIXTURES_DIR, fixture['body_file']), 'rb') as f:
+                body = f.read()
+        else:
+            body = base64.b64decode(fixture['body'])
         
-        for job_card in job_cards:
+        response = requests.Response()
+        response.status_code = fixture['status']
+        response.reason = fixture.get('reason', '')
+        response.headers = requests.structures.CaseInsensitiveDict(fixture['headers'])
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response._content = body
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        return response
+
+def make_http_adapter(pool_connections, pool_maxsize):
+    """Return the transport adapter selected by HTTP_TRANSPORT."""
+    if HTTP_TRANSPORT in ('record', 'replay'):
+        return RecordReplayAdapter(HTTP_TRANSPORT, pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+    return HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+
+# HTTP SESSION POOL
+PLATFORM_HOSTS = {
+    'LinkedIn': 'linkedin.com',
+    'Indeed': 'indeed.com',
+    'ZipRecruiter': 'ziprecruiter.com',
+}
+
+def platform_for_url(url):
+    host = urlparse(url).netloc.lower()
+    for platform, domain in PLATFORM_HOSTS.items():
+        if host == domain or host.endswith('.' + domain):
+            return platform
+    return host
+
+class SessionPool:
+    """Long-lived requests sessions, one per platform.
+
+    Each session keeps up to `pool_maxsize` keep-alive connections per host
+    and its own cookie jar, so later searches skip the TCP/TLS handshakes and
+    the homepage warm-up. A platform's cookies are cleared and the warm-up is
+    repeated once they are older than `cookie_ttl` seconds.
+    """
+
+    def __init__(self, cookie_ttl=SESSION_COOKIE_TTL, pool_connections=SESSION_POOL_CONNECTIONS,
+                 pool_maxsize=SESSION_POOL_MAXSIZE):
+        self.cookie_ttl = cookie_ttl
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self._sessions = {}
+        self._warmed_at = {}
+        self._lock = threading.Lock()
+        self.warm_ups = 0
+        self.warm_ups_skipped = 0
+        # Sockets and locks inherited from a forked parent must not be used
+        os.register_at_fork(after_in_child=self._reset)
+
+    def _reset(self):
+        self._sessions = {}
+        self._warmed_at = {}
+        self._lock = threading.Lock()
+        self.warm_ups = 0
+        self.warm_ups_skipped = 0
+
+    def get(self, platform):
+        with self._lock:
+            session = self._sessions.get(platform)
+            if session is None:
+                session = requests.Session()
+                adapter = make_http_adapter(self.pool_connections, self.pool_maxsize)
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                self._sessions[platform] = session
+            return session
+
+    def needs_warm_up(self, platform):
+        """Return True if the platform has no cookies younger than cookie_ttl."""
+        with self._lock:
+            warmed_at = self._warmed_at.get(platform)
+            if warmed_at and time.monotonic() - warmed_at < self.cookie_ttl:
+                self.warm_ups_skipped += 1
+                return False
+            if warmed_at and platform in self._sessions:
+                self._sessions[platform].cookies.clear()
+                del self._warmed_at[platform]
+            return True
+
+    def mark_warm(self, platform):
+        with self._lock:
+            self._warmed_at[platform] = time.monotonic()
+            self.warm_ups += 1
+
+    def stats(self):
+        """Requests, new connections and connection reuse rate per platform.
+
+        The counts come from the urllib3 connection pools, so they cover only
+        hosts whose pool has not been evicted.
+        """
+        with self._lock:
+            sessions = dict(self._sessions)
+            stats = {'warm_ups': self.warm_ups, 'warm_ups_skipped': self.warm_ups_skipped, 'platforms': {}}
+        for platform, session in sessions.items():
+            sent = opened = 0
+            for adapter in {id(a): a for a in session.adapters.values()}.values():
+                pools = adapter.poolmanager.pools
+                for key in pools.keys():
+                    pool = pools.get(key)
+                    if pool is not None:
+                        sent += pool.num_requests
+                        opened += pool.num_connections
+            stats['platforms'][platform] = {
+                'requests': sent,
+                'connections': opened,
+                'reuse_rate': round(1 - opened / sent, 3) if sent else 0.0
+            }
+        return stats
+
+session_pool = SessionPool()
+
+# FETCH ENGINE
+class FetchEngine:
+    """Fetch pages concurrently on an asyncio event loop.
+
+    Requests to the same host share a semaphore, so at most `concurrency` of
+    them are in flight per job board, and each slot waits a random politeness
+    delay with asyncio.sleep before it is handed to the next request. All
+    requests go through the platform's pooled session, so they share its
+    keep-alive connections and the cookies set by the warm-up request. Once
+    `budget` requests have been made the engine stops issuing new ones.
+    """
+
+    def __init__(self, platform, headers=None, concurrency=SCRAPE_CONCURRENCY_PER_HOST,
+                 delay=SCRAPE_POLITENESS_DELAY, budget=SCRAPE_REQUEST_BUDGET,
+                 timeout=SCRAPE_TIMEOUT):
+        self.platform = platform
+        self.session = session_pool.get(platform)
+        self.headers = headers or BROWSER_HEADERS
+        self.concurrency = concurrency
+        self.delay = delay
+        self.budget = budget
+        self.timeout = timeout
+        self.requests_made = 0
+        self._semaphores = {}
+
+    def _semaphore(self, url):
+        host = urlparse(url).netloc
+        if host not in self._semaphores:
+            self._semaphores[host] = asyncio.Semaphore(self.concurrency)
+        return self._semaphores[host]
+
+    async def get(self, url):
+        """Fetch one URL. Returns None if the request budget is already spent."""
+        async with self._semaphore(url):
+            if self.requests_made >= self.budget:
+                print(f"Request budget of {self.budget} spent, skipping {url}")
+                return None
+            self.requests_made += 1
             try:
-                # Try different selectors for each element
-                title_elem = (
-                    job_card.select_one('.jobTitle') or 
-                    job_card.select_one('.jcs-JobTitle') or
-                    job_card.select_one('.jobsearch-JobComponent-title')
-                )
-                company_elem = (
-                    job_card.select_one('.companyName') or 
-                    job_card.select_one('.companyLocation') or
-                    job_card.select_one('.jobsearch-CompanyInfoContainer')
+                response = await asyncio.to_thread(
+                    self.session.get, url, headers=self.headers, timeout=self.timeout
                 )
-                location_elem = (
-                    job_card.select_one('.companyLocation') or 
-                    job_card.select_one('.jobsearch-CompanyLocation') or
-                    job_card.select_one('.jobsearch-CompanyInfoContainer')
-                )
-                link_elem = (
-                    job_card.select_one('a.jcs-JobTitle') or 
-                    job_card.select_one('a.jobLink') or
-                    job_card.select_one('a.jobsearch-JobComponent-title')
-                )
-                
-                if not all([title_elem, company_elem, location_elem, link_elem]):
-                    continue
-                
-                job = {
-                    'title': title_elem.text.strip(),
-                    'company': company_elem.text.strip(),
-                    'company_info': '',
-                    'location': location_elem.text.strip(),
-                    'url': urljoin('https://www.indeed.com', link_elem['href']),
-                    'date_posted': datetime.now().strftime('%Y-%m-%d'),
-                    'platform': 'Indeed',
-                    'description': 'Click "Details" to view full description',
-                    'requirements': [],
-                    'match_score': 'N/A',
-                    'salary_min': '',
-                    'salary_max': '',
-                    'salary_currency': '',
-                    'benefits': []
-                }
-                
-                jobs.append(job)
-                print(f"Added Indeed job: {job['title']} at {job['company']}")
+            finally:
+                if HTTP_TRANSPORT != 'replay':
+                    await asyncio.sleep(random.uniform(*self.delay))
+            response.raise_for_status()
+            return response
+
+    async def _fetch_all(self, urls, warm_up):
+        if warm_up and session_pool.needs_warm_up(self.platform):
+            try:
+                await self.get(warm_up)
+                session_pool.mark_warm(self.platform)
             except Exception as e:
-                print(f"Error parsing Indeed job card: {str(e)}")
-                continue
-        
-        print(f"Found {len(jobs)} Indeed jobs")
-        return jobs
-    except Exception as e:
-        print(f"Error fetching Indeed jobs: {str(e)}")
+                print(f"Warning: Could not access {warm_up}: {str(e)}")
+        return await asyncio.gather(*(self.get(url) for url in urls), return_exceptions=True)
+
+    def fetch_all(self, urls, warm_up=None):
+        """Fetch `urls` concurrently, after a warm-up request if the platform needs one.
+
+        Returns one entry per URL, in order: the response, None when the
+        request budget ran out, or the exception raised while fetching it.
+        """
+        # Semaphores are bound to the loop that created them
+        self._semaphores = {}
+        return asyncio.run(self._fetch_all(urls, warm_up))
+
+# SCRAPE CACHE
+class TTLCache:
+    """Thread-safe LRU cache whose entries expire after `ttl` seconds.
+
+    get_or_fetch() also collapses concurrent misses for the same key into one
+    call: overlapping requests wait for the first caller's result instead of
+    fetching it again.
+    """
+
+    def __init__(self, ttl, maxsize):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries = OrderedDict()  # key -> (expires_at, value), oldest first
+        self._inflight = {}            # key -> Future of the running fetch
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.shared = 0
+        self.evictions = 0
+
+    def get_or_fetch(self, key, fetch):
+        """Return the cached value for `key`, calling `fetch()` on a miss.
+
+        Falsy results are returned but not cached, so a failed scrape is
+        retried by the next request.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            if entry:
+                del self._entries[key]
+            future = self._inflight.get(key)
+            if future is not None:
+                self.shared += 1
+                owner = False
+            else:
+                self.misses += 1
+                future = self._inflight[key] = Future()
+                owner = True
+        if not owner:
+            return future.result()
+        try:
+            value = fetch()
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(value)
+            if value:
+                self._store(key, value)
+            return value
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    def _store(self, key, value):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses + self.shared
+            return {
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+                'ttl': self.ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+                'shared': self.shared,
+                'evictions': self.evictions,
+                'hit_rate': round((self.hits + self.shared) / lookups, 3) if lookups else 0.0
+            }
+
+scrape_cache = TTLCache(SCRAPE_CACHE_TTL, SCRAPE_CACHE_SIZE)
+
+def normalize_query(text):
+    return ' '.join((text or '').lower().split())
+
+def cached_scrape(platform):
+    """Serve a platform fetcher from scrape_cache, keyed by the normalized query."""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(keyword, location):
+            key = (platform, normalize_query(keyword), normalize_query(location))
+            jobs = scrape_cache.get_or_fetch(key, lambda: func(keyword, location))
+            # Callers may modify the job dicts, so hand out copies
+            return [dict(job) for job in jobs]
+        return wrapper
+    return decorator
+
+def log_response(platform, response):
+    print(f"{platform} response status code: {response.status_code}")
+    print(f"{platform} response content type: {response.headers.get('content-type', 'unknown')}")
+    print(f"{platform} response length: {len(response.text)}")
+
+# HTML EXTRACTION
+# Per-platform extraction specs. 'cards' lists the card selectors, tried in
+# order until one matches. Each field maps to (value, selectors): the
+# selectors are tried in order within the card, and value says what to take
+# from the first match:
+#   'text'   - its text, stripped
+#   'joined' - each text node stripped, joined without separators
+#   'lines'  - the non-empty lines of its text
+#   anything else - that attribute
+EXTRACTION_SPECS = {
+    'LinkedIn': {
+        'cards': ['.jobs-search__results-list li', '.job-card-container'],
+        'fields': {
+            'title': ('text', ['.base-search-card__title', '.job-card-list__title', '.job-search-card__title']),
+            'company': ('text', ['.base-search-card__subtitle', '.job-card-container__company-name', '.job-search-card__company-name']),
+            'location': ('text', ['.job-search-card__location', '.job-card-container__metadata-item']),
+            'url': ('href', ['a.base-card__full-link', 'a.job-card-container__link', 'a.job-search-card__link']),
+        },
+    },
+    'Indeed': {
+        'cards': ['.job_seen_beacon', '.jobsearch-ResultsList > div'],
+        'fields': {
+            'title': ('text', ['.jobTitle', '.jcs-JobTitle', '.jobsearch-JobComponent-title']),
+            'company': ('text', ['.companyName', '.companyLocation', '.jobsearch-CompanyInfoContainer']),
+            'location': ('text', ['.companyLocation', '.jobsearch-CompanyLocation', '.jobsearch-CompanyInfoContainer']),
+            'url': ('href', ['a.jcs-JobTitle', 'a.jobLink', 'a.jobsearch-JobComponent-title']),
+        },
+    },
+    'ZipRecruiter': {
+        'cards': ['.job_content', '.job-listing'],
+        'fields': {
+            'title': ('text', ['.job_title', '.job-title', '.job-listing-title']),
+            'company': ('text', ['.company_name', '.company-name', '.job-listing-company']),
+            'location': ('text', ['.location', '.job-location', '.job-listing-location']),
+            'url': ('href', ['a.job_link', 'a.job-link', 'a.job-listing-link']),
+        },
+    },
+    'details': {
+        'fields': {
+            'description': ('joined', ['.job-description', '.description__text', '.job-description__content', '.show-more-less-html__markup']),
+            'requirements': ('lines', ['.job-criteria-list', '.job-criteria', '.job-requirements']),
+            'benefits': ('lines', ['.job-benefits', '.benefits', '.job-perks']),
+            'salary_info': ('joined', ['.salary', '.compensation', '.job-salary']),
+        },
+    },
+}
+
+class CompiledSpec:
+    """An extraction spec with every selector compiled to XPath once.
+
+    Pages are parsed with lxml. Card pages are only parsed from the first
+    opening tag carrying a card class onwards, so the head, navigation and
+    inline scripts before the results are skipped.
+    """
+
+    _text_nodes = etree.XPath('.//text()') if lxml_html is not None else None
+
+    def __init__(self, spec):
+        self.card_selectors = [CSSSelector(selector) for selector in spec.get('cards', [])]
+        self.fields = {
+            name: (value, [CSSSelector(selector) for selector in selectors])
+            for name, (value, selectors) in spec['fields'].items()
+        }
+        # The leftmost class of each card selector marks where its subtree starts.
+        # Only a class attribute of an opening tag counts, not text in scripts.
+        anchors = [re.match(r'\.([\w-]+)', selector).group(1) for selector in spec.get('cards', [])]
+        self.anchor = re.compile(
+            r'<[A-Za-z][^>]*?\sclass\s*=\s*["\']?[^"\'>]*?(?<![\w-])(?:%s)(?![\w-])'
+            % '|'.join(map(re.escape, anchors))
+        ) if anchors else None
+
+    def start(self, html):
+        """Return the offset of the first card container's opening tag, or 0."""
+        match = self.anchor.search(html) if self.anchor else None
+        return match.start() if match else 0
+
+    def parse(self, html, anchored=True):
+        if anchored:
+            html = html[self.start(html):]
+        return lxml_html.fromstring(html) if html.strip() else None
+
+    def value(self, element, value):
+        if value == 'text':
+            return element.text_content().strip()
+        if value == 'joined':
+            return ''.join(text.strip() for text in self._text_nodes(element))
+        if value == 'lines':
+            return [line.strip() for line in element.text_content().split('\n') if line.strip()]
+        return element.get(value)
+
+    def extract(self, root):
+        """Return {field: value} for every field found under `root`."""
+        values = {}
+        for name, (value, selectors) in self.fields.items():
+            for selector in selectors:
+                found = selector(root)
+                if found:
+                    values[name] = self.value(found[0], value)
+                    break
+        return values
+
+    def cards(self, root):
+        for selector in self.card_selectors:
+            cards = selector(root)
+            if cards:
+                return cards
+        return []
+
+COMPILED_SPECS = (
+    {name: CompiledSpec(spec) for name, spec in EXTRACTION_SPECS.items()}
+    if lxml_html is not None else {}
+)
+
+def soup_value(element, value):
+    if value == 'text':
+        return element.text.strip()
+    if value == 'joined':
+        return element.get_text(strip=True)
+    if value == 'lines':
+        return [line.strip() for line in element.get_text().split('\n') if line.strip()]
+    return element.get(value)
+
+def extract_soup_fields(spec, root):
+    values = {}
+    for name, (value, selectors) in spec['fields'].items():
+        for selector in selectors:
+            element = root.select_one(selector)
+            if element:
+                values[name] = soup_value(element, value)
+                break
+    return values
+
+def extract_cards_soup(platform, html):
+    """Extract card fields with BeautifulSoup; used when lxml is not installed."""
+    spec = EXTRACTION_SPECS[platform]
+    soup = BeautifulSoup(html, 'html.parser')
+    cards = []
+    for selector in spec['cards']:
+        cards = soup.select(selector)
+        if cards:
+            break
+    return [extract_soup_fields(spec, card) for card in cards]
+
+def extract_cards_lxml(platform, html):
+    spec = COMPILED_SPECS[platform]
+    root = spec.parse(html)
+    cards = spec.cards(root) if root is not None else []
+    if not cards and spec.start(html):
+        # The anchor was not the results container; read the whole page instead
+        root = spec.parse(html, anchored=False)
+        cards = spec.cards(root) if root is not None else []
+    return [spec.extract(card) for card in cards]
+
+def extract_cards(platform, html):
+    """Return the field values of every job card on a search results page."""
+    if COMPILED_SPECS:
+        return extract_cards_lxml(platform, html)
+    return extract_cards_soup(platform, html)
+
+def extract_details(html):
+    """Return the field values found on a job posting page."""
+    if COMPILED_SPECS:
+        spec = COMPILED_SPECS['details']
+        root = spec.parse(html)
+        return spec.extract(root) if root is not None else {}
+    return extract_soup_fields(EXTRACTION_SPECS['details'], BeautifulSoup(html, 'html.parser'))
+
+def parse_listings(platform, html):
+    """Turn a search results page into job listings, skipping incomplete cards."""
+    base_url = f"https://www.{PLATFORM_HOSTS[platform]}"
+    today = datetime.now().strftime('%Y-%m-%d')
+    cards = extract_cards(platform, html)
+    print(f"Found {len(cards)} {platform} job cards")
+    jobs = []
+    for card in cards:
+        if not all(card.get(field) for field in ('title', 'company', 'location', 'url')):
+            continue
+        jobs.append({
+            'title': card['title'],
+            'company': card['company'],
+            'company_info': '',
+            'location': card['location'],
+            'url': urljoin(base_url, card['url']),
+            'date_posted': today,
+            'platform': platform,
+            'description': DETAILS_PLACEHOLDER,
+            'requirements': [],
+            'match_score': 'N/A',
+            'salary_min': '',
+            'salary_max': '',
+            'salary_currency': '',
+            'benefits': []
+        })
+    return jobs
+
+def benchmark_parsers(fixtures_dir=HTML_FIXTURES_DIR, rounds=20):
+    """Print cards/second per platform for the lxml and BeautifulSoup paths.
+
+    Runs both extractors over the saved search pages in `fixtures_dir`
+    (<platform>_search.html) and warns if their results differ.
+    """
+    print(f"{'platform':<14}{'parser':<15}{'cards':>7}{'cards/s':>12}")
+    for platform in PLATFORM_HOSTS:
+        path = os.path.join(fixtures_dir, f"{platform.lower()}_search.html")
+        if not os.path.exists(path):
+            print(f"{platform:<14}missing fixture {path}")
+            continue
+        with open(path, encoding='utf-8') as f:
+            html = f.read()
+        results = {}
+        extractors = [('beautifulsoup', extract_cards_soup)]
+        if COMPILED_SPECS:
+            extractors.append(('lxml', extract_cards_lxml))
+        for name, extract in extractors:
+            start = time.perf_counter()
+            for _ in range(rounds):
+                cards = extract(platform, html)
+            elapsed = time.perf_counter() - start
+            results[name] = cards
+            print(f"{platform:<14}{name:<15}{len(cards):>7}{len(cards) * rounds / elapsed:>12.0f}")
+        if len(results) == 2 and results['beautifulsoup'] != results['lxml']:
+            print(f"Warning: lxml and BeautifulSoup results differ for {platform}")
+
+@cached_scrape('LinkedIn')
+def fetch_linkedin_jobs(keyword, location):
+    if location.lower() in REMOTE_LOCATIONS:
+        base_url = f"https://www.linkedin.com/jobs/search/?keywords={quote_plus(keyword)}&location=Worldwide&f_WT=2"
+    else:
+        base_url = f"https://www.linkedin.com/jobs/search/?keywords={quote_plus(keyword)}&location={quote_plus(location)}"
+    # LinkedIn paginates with the 'start' parameter (0, 25, 50, ...)
+    starts = range(0, LINKEDIN_PAGES * 25, 25)
+    search_urls = [f"{base_url}&start={start}" for start in starts]
+    print(f"\nFetching {len(search_urls)} LinkedIn result pages from: {base_url}")
+    
+    engine = FetchEngine('LinkedIn')
+    responses = engine.fetch_all(search_urls, warm_up='https://www.linkedin.com')
+    
+    errors = [response for response in responses if isinstance(response, Exception)]
+    if errors and len(errors) == len(responses):
+        # Every page failed, so the query is an error rather than an empty result
+        raise errors[0]
+    jobs = []
+    for start, response in zip(starts, responses):
+        if isinstance(response, Exception):
+            print(f"Error fetching LinkedIn page starting at {start}: {str(response)}")
+            continue
+        if response is None:
+            continue
+        log_response('LinkedIn', response)
+        page_jobs = parse_listings('LinkedIn', response.text)
+        print(f"Found {len(page_jobs)} LinkedIn jobs on page starting at {start}")
+        jobs.extend(page_jobs)
+    print(f"Found {len(jobs)} total LinkedIn jobs across all pages")
+    return jobs
+
+@cached_scrape('Indeed')
+def fetch_indeed_jobs(keyword, location):
+    # Handle remote locations
+    if location.lower() in REMOTE_LOCATIONS:
+        search_url = f"https://www.indeed.com/jobs?q={quote_plus(keyword)}&sc=0kf%3Aattr(FSFW)%3B"
+    else:
+        search_url = f"https://www.indeed.com/jobs?q={quote_plus(keyword)}&l={quote_plus(location)}"
+    
+    print(f"\nFetching Indeed jobs from: {search_url}")
+    
+    # Warm up cookies on the main page, then fetch the search results
+    engine = FetchEngine('Indeed')
+    response = engine.fetch_all([search_url], warm_up='https://www.indeed.com')[0]
+    if isinstance(response, Exception):
+        raise response
+    if response is None:
         return []
+    
+    log_response('Indeed', response)
+    jobs = parse_listings('Indeed', response.text)
+    
+    print(f"Found {len(jobs)} Indeed jobs")
+    return jobs
 
-@rate_limit
+@cached_scrape('ZipRecruiter')
 def fetch_ziprecruiter_jobs(keyword, location):
-    try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.9',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-            'Cache-Control': 'no-cache',
-            'Pragma': 'no-cache',
-            'Sec-Fetch-Dest': 'document',
-            'Sec-Fetch-Mode': 'navigate',
-            'Sec-Fetch-Site': 'none',
-            'Sec-Fetch-User': '?1',
-            'DNT': '1'
-        }
-        
-        # Handle remote locations
-        if location.lower() in ['remote', 'work from home', 'anywhere']:
-            search_url = f"https://www.ziprecruiter.com/jobs-search?search={quote_plus(keyword)}&location=Remote"
-        else:
-            search_url = f"https://www.ziprecruiter.com/jobs-search?search={quote_plus(keyword)}&location={quote_plus(location)}"
-        
-        print(f"\nFetching ZipRecruiter jobs from: {search_url}")
-        session = requests.Session()
-        
-        # First make a GET request to the main page
+    # Handle remote locations
+    if location.lower() in REMOTE_LOCATIONS:
+        search_url = f"https://www.ziprecruiter.com/jobs-search?search={quote_plus(keyword)}&location=Remote"
+    else:
+        search_url = f"https://www.ziprecruiter.com/jobs-search?search={quote_plus(keyword)}&location={quote_plus(location)}"
+    
+    print(f"\nFetching ZipRecruiter jobs from: {search_url}")
+    
+    # Warm up cookies on the main page, then fetch the search results
+    engine = FetchEngine('ZipRecruiter')
+    response = engine.fetch_all([search_url], warm_up='https://www.ziprecruiter.com')[0]
+    if isinstance(response, Exception):
+        raise response
+    if response is None:
+        return []
+    
+    log_response('ZipRecruiter', response)
+    jobs = parse_listings('ZipRecruiter', response.text)
+    
+    print(f"Found {len(jobs)} ZipRecruiter jobs")
+    return jobs
+
+# Fetchers raise when a search page cannot be fetched, so callers can record the error
+PLATFORM_FETCHERS = {
+    'LinkedIn': fetch_linkedin_jobs,
+    'Indeed': fetch_indeed_jobs,
+    'ZipRecruiter': fetch_ziprecruiter_jobs,
+}
+
+# Shared so fetchers that miss the deadline can finish without blocking the caller
+scrape_executor = ThreadPoolExecutor(max_workers=SCRAPE_WORKERS, thread_name_prefix='scrape')
+
+def fetch_platforms(keyword, location, platforms=None, deadline=PLATFORM_DEADLINE):
+    """Query several platforms at once and wait at most `deadline` seconds.
+
+    Returns the jobs from every platform that finished in time, plus a status
+    entry per platform ('ok', 'error' or 'timeout') with its job count and
+    elapsed time. Fetchers still running at the deadline keep running in the
+    background, but their results are not included.
+    """
+    platforms = list(PLATFORM_FETCHERS) if platforms is None else platforms
+    started = time.monotonic()
+    elapsed = {}
+    futures = {}
+    for platform in platforms:
+        future = scrape_executor.submit(PLATFORM_FETCHERS[platform], keyword, location)
+        future.add_done_callback(
+            lambda f, platform=platform: elapsed.setdefault(platform, time.monotonic() - started)
+        )
+        futures[future] = platform
+    
+    done, _ = wait(futures, timeout=deadline)
+    
+    jobs = []
+    status = {}
+    for future, platform in futures.items():
+        if future not in done:
+            print(f"{platform} missed the {deadline}s deadline, returning partial results")
+            status[platform] = {'status': 'timeout', 'count': 0, 'elapsed': deadline}
+            continue
         try:
-            response = session.get('https://www.ziprecruiter.com', headers=headers, timeout=10)
-            response.raise_for_status()
-            time.sleep(random.uniform(2, 4))  # Wait before the next request
+            platform_jobs = future.result()
         except Exception as e:
-            print(f"Warning: Could not access ZipRecruiter main page: {str(e)}")
-        
-        # Now fetch the search results
-        response = session.get(search_url, headers=headers, timeout=10)
-        response.raise_for_status()
-        
-        print(f"ZipRecruiter response status code: {response.status_code}")
-        print(f"ZipRecruiter response content type: {response.headers.get('content-type', 'unknown')}")
-        print(f"ZipRecruiter response length: {len(response.text)}")
-        
-        soup = BeautifulSoup(response.text, 'html.parser')
-        jobs = []
-        
-        # Try different selectors for job cards
-        job_cards = soup.select('.job_content') or soup.select('.job-listing')
-        print(f"Found {len(job_cards)} ZipRecruiter job cards")
-        
-        for job_card in job_cards:
-            try:
-                # Try different selectors for each element
-                title_elem = (
-                    job_card.select_one('.job_title') or 
-                    job_card.select_one('.job-title') or
-                    job_card.select_one('.job-listing-title')
-                )
-                company_elem = (
-                    job_card.select_one('.company_name') or 
-                    job_card.select_one('.company-name') or
-                    job_card.select_one('.job-listing-company')
-                )
-                location_elem = (
-                    job_card.select_one('.location') or 
-                    job_card.select_one('.job-location') or
-                    job_card.select_one('.job-listing-location')
-                )
-                link_elem = (
-                    job_card.select_one('a.job_link') or 
-                    job_card.select_one('a.job-link') or
-                    job_card.select_one('a.job-listing-link')
-                )
-                
-                if not all([title_elem, company_elem, location_elem, link_elem]):
-                    continue
-                
-                job = {
-                    'title': title_elem.text.strip(),
-                    'company': company_elem.text.strip(),
-                    'company_info': '',
-                    'location': location_elem.text.strip(),
-                    'url': link_elem['href'],
-                    'date_posted': datetime.now().strftime('%Y-%m-%d'),
-                    'platform': 'ZipRecruiter',
-                    'description': 'Click "Details" to view full description',
-                    'requirements': [],
-                    'match_score': 'N/A',
-                    'salary_min': '',
-                    'salary_max': '',
-                    'salary_currency': '',
-                    'benefits': []
-                }
-                
-                jobs.append(job)
-                print(f"Added ZipRecruiter job: {job['title']} at {job['company']}")
-            except Exception as e:
-                print(f"Error parsing ZipRecruiter job card: {str(e)}")
-                continue
-        
-        print(f"Found {len(jobs)} ZipRecruiter jobs")
-        return jobs
-    except Exception as e:
-        print(f"Error fetching ZipRecruiter jobs: {str(e)}")
-        return []
+            print(f"Error fetching {platform} jobs: {str(e)}")
+            status[platform] = {'status': 'error', 'count': 0, 'error': str(e)}
+        else:
+            jobs.extend(platform_jobs)
+            status[platform] = {'status': 'ok', 'count': len(platform_jobs)}
+        status[platform]['elapsed'] = round(elapsed.get(platform, 0), 2)
+    return jobs, status
 
 def fetch_all_jobs(keyword, location):
     print(f"\nFetching jobs for keyword: {keyword}, location: {location}")
-    jobs = []
-    
-    # Clear existing jobs from database for this search
-    conn = get_conn()
-    conn.execute('DELETE FROM jobs')
-    conn.commit()
-    conn.close()
     
-    with ThreadPoolExecutor(max_workers=3) as executor:
-        futures = [
-            executor.submit(fetch_linkedin_jobs, keyword, location),
-            executor.submit(fetch_indeed_jobs, keyword, location),
-            executor.submit(fetch_ziprecruiter_jobs, keyword, location)
-        ]
-        
-        for future in futures:
-            try:
-                platform_jobs = future.result()
-                if platform_jobs:  # Only extend if we got jobs
-                    jobs.extend(platform_jobs)
-            except Exception as e:
-                print(f"Error in job fetch: {str(e)}")
+    jobs, _ = fetch_platforms(keyword, location)
     
     # Remove duplicates based on URL
     seen_urls = set()
@@ -446,9 +991,150 @@ def fetch_all_jobs(keyword, location):
     
     return unique_jobs
 
+# JOB DETAIL PAGE CACHE
+class DetailPageCache:
+    """Content-addressed disk cache of job posting pages.
+
+    Each body is stored once under bodies/, named by its SHA-256. Each URL has
+    an index entry with the page's ETag and Last-Modified, the hash of its
+    last body and the details extracted from that body. Entries younger than
+    `fresh` seconds are served without a request; older ones are revalidated
+    with a conditional GET. Entries are evicted after `max_age` seconds, and
+    the least recently checked go first once bodies exceed `max_bytes`.
+    """
+
+    def __init__(self, root=DETAIL_CACHE_DIR, fresh=DETAIL_CACHE_FRESH,
+                 max_age=DETAIL_CACHE_MAX_AGE, max_bytes=DETAIL_CACHE_MAX_BYTES):
+        self.root = root
+        self.fresh = fresh
+        self.max_age = max_age
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._last_eviction = 0
+        self.counts = {'fresh': 0, 'not_modified': 0, 'unchanged': 0, 'parsed': 0, 'evicted': 0}
+
+    def _index_path(self, url):
+        return os.path.join(self.root, 'index', hashlib.sha256(url.encode()).hexdigest() + '.json')
+
+    def _body_path(self, content_hash):
+        return os.path.join(self.root, 'bodies', content_hash + '.html.gz')
+
+    def _remove(self, path):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    def _write(self, path, data):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def count(self, outcome):
+        with self._lock:
+            self.counts[outcome] += 1
+
+    def lookup(self, url):
+        try:
+            with open(self._index_path(url), encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def is_fresh(self, entry):
+        return time.time() - entry['checked_at'] < self.fresh
+
+    def conditional_headers(self, entry):
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def revalidated(self, url, entry):
+        """Record that the page behind `entry` was confirmed unchanged."""
+        entry['checked_at'] = time.time()
+        self._write(self._index_path(url), json.dumps(entry).encode())
+
+    def store(self, url, response, content_hash, details):
+        body_path = self._body_path(content_hash)
+        if not os.path.exists(body_path):
+            self._write(body_path, gzip.compress(response.content))
+        now = time.time()
+        entry = {
+            'url': url,
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'content_hash': content_hash,
+            'fetched_at': now,
+            'checked_at': now,
+            'details': details
+        }
+        self._write(self._index_path(url), json.dumps(entry).encode())
+        if now - self._last_eviction > DETAIL_CACHE_EVICT_INTERVAL:
+            self._last_eviction = now
+            self.evict()
+
+    def evict(self):
+        """Drop expired entries, then the least recently checked ones while over max_bytes."""
+        index_dir = os.path.join(self.root, 'index')
+        body_dir = os.path.join(self.root, 'bodies')
+        if not os.path.isdir(index_dir):
+            return
+        now = time.time()
+        entries = []
+        for name in os.listdir(index_dir):
+            path = os.path.join(index_dir, name)
+            try:
+                with open(path, encoding='utf-8') as f:
+                    entry = json.load(f)
+            except (OSError, ValueError):
+                continue
+            if now - entry['fetched_at'] > self.max_age:
+                self._remove(path)
+                self.count('evicted')
+            else:
+                entries.append((entry['checked_at'], path, entry['content_hash']))
+        sizes = {}
+        for name in os.listdir(body_dir) if os.path.isdir(body_dir) else []:
+            sizes[name[:-len('.html.gz')]] = os.path.getsize(os.path.join(body_dir, name))
+        # Oldest first, so the loop below evicts the least recently checked
+        entries.sort()
+        referenced = Counter(content_hash for _, _, content_hash in entries)
+        total = sum(sizes[h] for h in referenced if h in sizes)
+        for _, path, content_hash in entries:
+            if total <= self.max_bytes:
+                break
+            self._remove(path)
+            self.count('evicted')
+            referenced[content_hash] -= 1
+            if referenced[content_hash] == 0:
+                total -= sizes.get(content_hash, 0)
+        for content_hash in sizes:
+            if referenced[content_hash] <= 0:
+                self._remove(self._body_path(content_hash))
+
+    def stats(self):
+        with self._lock:
+            return dict(self.counts)
+
+detail_cache = DetailPageCache()
+
 def fetch_job_details(url):
-    """Fetch detailed job information from the job posting URL."""
+    """Fetch detailed job information from the job posting URL.
+
+    Served from detail_cache while fresh. Otherwise the page is requested
+    conditionally, and only re-parsed when its content hash has changed.
+    """
     try:
+        entry = detail_cache.lookup(url)
+        if entry and detail_cache.is_fresh(entry):
+            detail_cache.count('fresh')
+            return entry['details']
+        
         headers = {
             'User-Agent': get_random_user_agent(),
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
@@ -456,69 +1142,177 @@ def fetch_job_details(url):
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
         }
+        if entry:
+            headers.update(detail_cache.conditional_headers(entry))
         
-        session = requests.Session()
-        response = session.get(url, headers=headers, timeout=10)
+        session = session_pool.get(platform_for_url(url))
+        response = session.get(url, headers=headers, timeout=SCRAPE_TIMEOUT)
+        if response.status_code == 304 and entry:
+            detail_cache.count('not_modified')
+            detail_cache.revalidated(url, entry)
+            return entry['details']
         response.raise_for_status()
         
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        # Extract job description
-        description = ''
-        description_elem = (
-            soup.select_one('.job-description') or 
-            soup.select_one('.description__text') or
-            soup.select_one('.job-description__content') or
-            soup.select_one('.show-more-less-html__markup')
-        )
-        if description_elem:
-            description = description_elem.get_text(strip=True)
-        
-        # Extract requirements
-        requirements = []
-        requirements_elem = (
-            soup.select_one('.job-criteria-list') or
-            soup.select_one('.job-criteria') or
-            soup.select_one('.job-requirements')
-        )
-        if requirements_elem:
-            requirements = [req.strip() for req in requirements_elem.get_text().split('\n') if req.strip()]
-        
-        # Extract benefits
-        benefits = []
-        benefits_elem = (
-            soup.select_one('.job-benefits') or
-            soup.select_one('.benefits') or
-            soup.select_one('.job-perks')
-        )
-        if benefits_elem:
-            benefits = [benefit.strip() for benefit in benefits_elem.get_text().split('\n') if benefit.strip()]
-        
-        # Extract salary information
-        salary_info = ''
-        salary_elem = (
-            soup.select_one('.salary') or
-            soup.select_one('.compensation') or
-            soup.select_one('.job-salary')
-        )
-        if salary_elem:
-            salary_info = salary_elem.get_text(strip=True)
-        
-        return {
-            'description': description,
-            'requirements': requirements,
-            'benefits': benefits,
-            'salary_info': salary_info
-        }
+        content_hash = hashlib.sha256(response.content).hexdigest()
+        if entry and entry['content_hash'] == content_hash:
+            detail_cache.count('unchanged')
+            details = entry['details']
+        else:
+            detail_cache.count('parsed')
+            extracted = extract_details(response.text)
+            details = {
+                'description': extracted.get('description', ''),
+                'requirements': extracted.get('requirements', []),
+                'benefits': extracted.get('benefits', []),
+                'salary_info': extracted.get('salary_info', '')
+            }
+        detail_cache.store(url, response, content_hash, details)
+        return details
     except Exception as e:
         print(f"Error fetching job details: {str(e)}")
         return {
-            'description': 'Error fetching job details. Please try again later.',
+            'description': DETAILS_ERROR,
             'requirements': [],
             'benefits': [],
             'salary_info': ''
         }
 
+def store_match_score(conn, job_id, match_percentage):
+    """Save a job's match score and return it in the API's 'NN.N%' form."""
+    match_value = round(match_percentage, 1)
+    match_score = f"{match_value}%"
+    conn.execute('UPDATE jobs SET match_value = ?, match_score = ? WHERE id = ?',
+                 (match_value, match_score, job_id))
+    conn.commit()
+    return match_score
+
+def needs_details(job):
+    return not job.get('description') or job['description'] == DETAILS_PLACEHOLDER
+
+def store_job_details(job_id, details):
+    """Write fetched details to the job's row unless the fetch failed."""
+    if details['description'] == DETAILS_ERROR:
+        return
+    conn = get_conn()
+    conn.execute('''
+        UPDATE jobs 
+        SET description = ?, requirements = ?
+        WHERE id = ?
+    ''', (details['description'], json.dumps(details.get('requirements', [])), job_id))
+    conn.commit()
+    conn.close()
+
+class DetailPrefetcher:
+    """Fetch job details ahead of time on a bounded worker pool.
+
+    All fetches go through get(), which lets concurrent requests for the same
+    URL share one in-flight fetch, whether they come from prefetching or from
+    a user opening the job. Fetched details are written back to the jobs row.
+    """
+
+    def __init__(self, workers=PREFETCH_WORKERS):
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='prefetch')
+        self._inflight = {}   # url -> Future of the running fetch
+        self._queued = set()  # urls submitted to the pool but not started
+        self._lock = threading.Lock()
+        self.fetched = 0
+        self.shared = 0
+
+    def get(self, job_id, url):
+        """Fetch and store the details of one job, joining a fetch already in flight."""
+        with self._lock:
+            self._queued.discard(url)
+            future = self._inflight.get(url)
+            owner = future is None
+            if owner:
+                future = self._inflight[url] = Future()
+                self.fetched += 1
+            else:
+                self.shared += 1
+        if not owner:
+            return future.result()
+        try:
+            details = fetch_job_details(url)
+            store_job_details(job_id, details)
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(details)
+            return details
+        finally:
+            with self._lock:
+                self._inflight.pop(url, None)
+
+    def prefetch(self, jobs):
+        """Queue detail fetches for the jobs that still show the placeholder."""
+        for job in jobs:
+            if not needs_details(job):
+                continue
+            with self._lock:
+                if job['url'] in self._inflight or job['url'] in self._queued:
+                    continue
+                self._queued.add(job['url'])
+            self._executor.submit(self._prefetch_one, job['id'], job['url'])
+
+    def _prefetch_one(self, job_id, url):
+        try:
+            self.get(job_id, url)
+        except Exception as e:
+            print(f"Error prefetching job details: {str(e)}")
+
+    def stats(self):
+        with self._lock:
+            return {
+                'fetched': self.fetched,
+                'shared': self.shared,
+                'in_flight': len(self._inflight),
+                'queued': len(self._queued)
+            }
+
+detail_prefetcher = DetailPrefetcher()
+
+def benchmark_search(keyword='python developer', location='Remote', rounds=5):
+    """Print end-to-end search throughput against the replay fixture store.
+
+    Each round clears the scrape cache, fetches every platform, saves the
+    listings and fetches each listing's details, so every round does the full
+    fetch, parse and save work. Jobs go to a scratch database and details to
+    a scratch cache, leaving jobs.db and the detail cache untouched.
+    """
+    global DB_PATH
+    if HTTP_TRANSPORT != 'replay':
+        print("bench-search only runs with HTTP_TRANSPORT=replay")
+        return
+    import tempfile
+    scratch = tempfile.mkdtemp(prefix='bench-search-')
+    DB_PATH = os.path.join(scratch, 'jobs.db')
+    init_db()
+    print(f"Replaying '{keyword}' in '{location}' from {HTTP_FIXTURES_DIR} "
+          f"(latency {REPLAY_LATENCY}s, error rate {REPLAY_ERROR_RATE:.0%}, seed {REPLAY_SEED})")
+    print(f"{'round':<7}{'jobs':>6}{'details':>9}{'failed':>8}{'seconds':>9}")
+    total_jobs = total_details = 0
+    total_elapsed = 0.0
+    with ThreadPoolExecutor(max_workers=PREFETCH_WORKERS) as executor:
+        for i in range(rounds):
+            scrape_cache.clear()
+            detail_cache.root = os.path.join(scratch, f"details-{i}")
+            start = time.perf_counter()
+            jobs, _ = fetch_platforms(keyword, location)
+            if jobs:
+                save_listings(jobs)
+            urls = list(dict.fromkeys(job['url'] for job in jobs))
+            details = list(executor.map(fetch_job_details, urls))
+            elapsed = time.perf_counter() - start
+            failed = sum(1 for d in details if d['description'] == DETAILS_ERROR)
+            print(f"{i + 1:<7}{len(jobs):>6}{len(details):>9}{failed:>8}{elapsed:>9.2f}")
+            total_jobs += len(jobs)
+            total_details += len(details)
+            total_elapsed += elapsed
+    if total_elapsed:
+        print(f"{total_jobs / total_elapsed:.1f} jobs/s, {total_details / total_elapsed:.1f} detail pages/s, "
+              f"{rounds / total_elapsed:.2f} searches/s")
+
 # APP INIT
 print(f"=== Loading UPDATED app.py at {time.asctime()} ===")
 app = Flask(__name__)
@@ -548,16 +1342,99 @@ def before_request():
         return response
 
 # DB UTILITIES
+class PooledConnection(sqlite3.Connection):
+    """SQLite connection whose close() hands it back to its pool."""
+    pool = None
+    idle = False
+
+    def close(self):
+        if self.pool is None or not self.pool.release(self):
+            super().close()
+
+class ConnectionPool:
+    """LIFO pool of SQLite connections configured with DB_PRAGMAS.
+
+    acquire() hands out an idle connection or opens a new one, so each
+    connection keeps its page cache and prepared statement cache across
+    requests. close() on a connection rolls back anything left uncommitted
+    and returns it to the pool, which keeps at most `size` idle. A
+    connection is only ever used by one caller at a time.
+    """
+
+    def __init__(self, size=DB_POOL_SIZE, pragmas=DB_PRAGMAS, cached_statements=DB_CACHED_STATEMENTS):
+        self.size = size
+        self.pragmas = pragmas
+        self.cached_statements = cached_statements
+        self._idle = {}
+        self._lock = threading.Lock()
+        self.opened = 0
+        self.reused = 0
+        # Connections and locks inherited from a forked parent must not be used
+        os.register_at_fork(after_in_child=self._reset)
+
+    def _reset(self):
+        self._idle = {}
+        self._lock = threading.Lock()
+        self.opened = 0
+        self.reused = 0
+
+    def acquire(self, path):
+        with self._lock:
+            idle = self._idle.get(path)
+            if idle:
+                self.reused += 1
+                conn = idle.pop()
+                conn.idle = False
+                return conn
+            self.opened += 1
+        conn = sqlite3.connect(path, factory=PooledConnection, check_same_thread=False,
+                               cached_statements=self.cached_statements)
+        conn.row_factory = sqlite3.Row
+        for name, value in self.pragmas.items():
+            conn.execute(f"PRAGMA {name} = {value}")
+        conn.pool = self
+        conn.path = path
+        return conn
+
+    def release(self, conn):
+        """Return `conn` to the pool. Returns False if the caller should really close it."""
+        if conn.idle:
+            return True
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+        except sqlite3.Error:
+            return False
+        conn.row_factory = sqlite3.Row
+        with self._lock:
+            idle = self._idle.setdefault(conn.path, [])
+            if len(idle) >= self.size:
+                return False
+            conn.idle = True
+            idle.append(conn)
+            return True
+
+    def stats(self):
+        with self._lock:
+            return {
+                'opened': self.opened,
+                'reused': self.reused,
+                'idle': sum(len(idle) for idle in self._idle.values())
+            }
+
+db_pool = ConnectionPool()
+
 def get_conn():
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-    return conn
+    return db_pool.acquire(DB_PATH)
 
-def init_db():
-    conn = get_conn()
-    c = conn.cursor()
-    
-    # Create jobs table
+# Set by init_db once the jobs_fts full-text index is in place
+fts_enabled = False
+
+# SCHEMA MIGRATIONS
+# Each step upgrades the schema by one version and must also work on
+# databases created before versioning, whose user_version is still 0.
+def migrate_base_tables(c):
+    """Create the base tables, the resume table and the legacy applications columns."""
     c.execute('''
         CREATE TABLE IF NOT EXISTS jobs (
             id INTEGER PRIMARY KEY,
@@ -574,8 +1451,6 @@ def init_db():
             fetched_at TIMESTAMP
         )
     ''')
-    
-    # Create applications table
     c.execute('''
         CREATE TABLE IF NOT EXISTS applications (
             id INTEGER PRIMARY KEY,
@@ -591,8 +1466,11 @@ def init_db():
             FOREIGN KEY (job_id) REFERENCES jobs (id)
         )
     ''')
-    
-    # Create saved_jobs table
+    # Columns added to applications after it was first created
+    columns = {row['name'] for row in c.execute('PRAGMA table_info(applications)')}
+    for column in ('company', 'location', 'referral', 'job_link', 'referral_mail', 'title'):
+        if column not in columns:
+            c.execute(f'ALTER TABLE applications ADD COLUMN {column} TEXT')
     c.execute('''
         CREATE TABLE IF NOT EXISTS saved_jobs (
             id INTEGER PRIMARY KEY,
@@ -601,43 +1479,621 @@ def init_db():
             FOREIGN KEY (job_id) REFERENCES jobs (id)
         )
     ''')
-    
+    c.execute('''
+        CREATE TABLE IF NOT EXISTS resume (
+            id INTEGER PRIMARY KEY,
+            filename TEXT,
+            uploaded_at TEXT
+        )
+    ''')
+    # Queries refreshed into the jobs table by the ingestion scheduler
+    c.execute('''
+        CREATE TABLE IF NOT EXISTS watched_queries (
+            id INTEGER PRIMARY KEY,
+            keyword TEXT,
+            location TEXT,
+            platform TEXT,
+            interval_seconds INTEGER,
+            next_run_at REAL,
+            leased_until REAL,
+            last_run_at REAL,
+            last_status TEXT,
+            last_count INTEGER,
+            last_error TEXT,
+            UNIQUE (keyword, location, platform)
+        )
+    ''')
+    c.execute('CREATE INDEX IF NOT EXISTS idx_watched_queries_next_run_at ON watched_queries (next_run_at)')
+    # Search result snapshots, paged through with keyset queries on position
+    c.execute('''
+        CREATE TABLE IF NOT EXISTS search_snapshots (
+            id TEXT PRIMARY KEY,
+            meta TEXT,
+            total INTEGER,
+            created_at REAL
+        )
+    ''')
+    c.execute('CREATE INDEX IF NOT EXISTS idx_search_snapshots_created_at ON search_snapshots (created_at)')
+    # Snapshots used to store each job as JSON; they are short-lived, so drop them
+    columns = {row['name'] for row in c.execute('PRAGMA table_info(search_snapshot_rows)')}
+    if 'job' in columns:
+        c.execute('DROP TABLE search_snapshot_rows')
+        c.execute('DELETE FROM search_snapshots')
+    c.execute('''
+        CREATE TABLE IF NOT EXISTS search_snapshot_rows (
+            snapshot_id TEXT,
+            position INTEGER,
+            job_id INTEGER,
+            PRIMARY KEY (snapshot_id, position)
+        ) WITHOUT ROWID
+    ''')
+
+def migrate_search_columns(c):
+    """Add the normalized search columns and numeric match score to jobs, with their indexes."""
+    columns = {row['name'] for row in c.execute('PRAGMA table_info(jobs)')}
+    if 'dedup_key' not in columns:
+        c.execute('ALTER TABLE jobs ADD COLUMN location_norm TEXT')
+        c.execute('ALTER TABLE jobs ADD COLUMN dedup_key TEXT')
+        backfill_search_columns(c)
+    if 'match_value' not in columns:
+        # Numeric copy of match_score ('N/A' or 'NN.N%'), NULL while unscored
+        c.execute('ALTER TABLE jobs ADD COLUMN match_value REAL')
+        c.execute('''
+            UPDATE jobs SET match_value = CAST(REPLACE(match_score, '%', '') AS REAL)
+            WHERE match_score IS NOT NULL AND match_score != 'N/A'
+        ''')
+    c.execute('CREATE UNIQUE INDEX IF NOT EXISTS idx_jobs_dedup_key ON jobs (dedup_key)')
+    c.execute('CREATE INDEX IF NOT EXISTS idx_jobs_platform_location ON jobs (platform, location)')
+    # Covers the platform and location filters, so searches are counted without reading rows
+    c.execute('''
+        CREATE INDEX IF NOT EXISTS idx_jobs_search ON jobs (platform, location_norm)
+        WHERE dedup_key IS NOT NULL
+    ''')
+    # Sort indexes also carry the filter columns, so a search reads them without the table
+    for column in ('date_posted', 'title', 'company', 'location', 'match_value'):
+        c.execute(f'''
+            CREATE INDEX IF NOT EXISTS idx_jobs_sort_{column} ON jobs ({column}, platform, location_norm)
+            WHERE dedup_key IS NOT NULL
+        ''')
+
+def migrate_jobs_fts(c):
+    """Create the jobs_fts full-text index over title, company and description.
+
+    It is an external content table over jobs, kept in sync by triggers, so
+    every write to jobs (save_listings, detail updates, deletes) updates it.
+    Skipped if this SQLite build has no FTS5.
+    """
+    exists = c.execute("SELECT 1 FROM sqlite_master WHERE name = 'jobs_fts'").fetchone()
+    try:
+        c.execute('''
+            CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+                title, company, description,
+                content='jobs', content_rowid='id', prefix='2 3'
+            )
+        ''')
+    except sqlite3.OperationalError as e:
+        print(f"Full-text search unavailable ({str(e)}), matching keywords as substrings")
+        return
+    c.execute('''
+        CREATE TRIGGER IF NOT EXISTS jobs_fts_insert AFTER INSERT ON jobs BEGIN
+            INSERT INTO jobs_fts (rowid, title, company, description)
+            VALUES (new.id, new.title, new.company, new.description);
+        END
+    ''')
+    c.execute('''
+        CREATE TRIGGER IF NOT EXISTS jobs_fts_delete AFTER DELETE ON jobs BEGIN
+            INSERT INTO jobs_fts (jobs_fts, rowid, title, company, description)
+            VALUES ('delete', old.id, old.title, old.company, old.description);
+        END
+    ''')
+    # Upserts rewrite description with its own value, which must not touch the index
+    c.execute('DROP TRIGGER IF EXISTS jobs_fts_update')
+    c.execute('''
+        CREATE TRIGGER jobs_fts_update AFTER UPDATE OF title, company, description ON jobs
+        WHEN old.title IS NOT new.title OR old.company IS NOT new.company
+            OR old.description IS NOT new.description
+        BEGIN
+            INSERT INTO jobs_fts (jobs_fts, rowid, title, company, description)
+            VALUES ('delete', old.id, old.title, old.company, old.description);
+            INSERT INTO jobs_fts (rowid, title, company, description)
+            VALUES (new.id, new.title, new.company, new.description);
+        END
+    ''')
+    c.execute("INSERT INTO jobs_fts (jobs_fts, rank) VALUES ('rank', ?)",
+              (f"bm25({', '.join(str(w) for w in FTS_WEIGHTS)})",))
+    if not exists:
+        # Index the jobs saved before the table existed
+        c.execute("INSERT INTO jobs_fts (jobs_fts) VALUES ('rebuild')")
+
+def migrate_hot_query_indexes(c):
+    """Index the lookups behind the tracker, saved jobs, apply and resume endpoints."""
+    c.execute('CREATE INDEX IF NOT EXISTS idx_applications_job_id ON applications (job_id)')
+    c.execute('CREATE INDEX IF NOT EXISTS idx_applications_status ON applications (status)')
+    c.execute('CREATE INDEX IF NOT EXISTS idx_saved_jobs_job_id ON saved_jobs (job_id)')
+    c.execute('CREATE INDEX IF NOT EXISTS idx_saved_jobs_saved_at ON saved_jobs (saved_at)')
+    c.execute('CREATE INDEX IF NOT EXISTS idx_resume_uploaded_at ON resume (uploaded_at)')
+    c.execute('ANALYZE')
+
+def migrate_tracker_index(c):
+    """Index applications by (status, applied_at) for the paged tracker."""
+    # The new index starts with status, so the single-column one is redundant
+    c.execute('DROP INDEX IF EXISTS idx_applications_status')
+    c.execute('CREATE INDEX IF NOT EXISTS idx_applications_status_applied_at ON applications (status, applied_at)')
+    c.execute('ANALYZE applications')
+
+def migrate_retained_jobs(c):
+    """Add jobs.last_seen_at, indexed for TTL compaction."""
+    columns = {row['name'] for row in c.execute('PRAGMA table_info(jobs)')}
+    if 'last_seen_at' not in columns:
+        c.execute('ALTER TABLE jobs ADD COLUMN last_seen_at TIMESTAMP')
+        c.execute('UPDATE jobs SET last_seen_at = fetched_at')
+    c.execute('CREATE INDEX IF NOT EXISTS idx_jobs_last_seen_at ON jobs (last_seen_at)')
+
+def migrate_saved_jobs_keyset(c):
+    """Make saved_jobs.job_id unique and keep a trigger-maintained row count."""
+    # Drop repeat saves, keeping the first, and saves of jobs that were deleted
+    c.execute('DELETE FROM saved_jobs WHERE id NOT IN (SELECT MIN(id) FROM saved_jobs GROUP BY job_id)')
+    c.execute('DELETE FROM saved_jobs WHERE job_id NOT IN (SELECT id FROM jobs)')
+    c.execute('DROP INDEX IF EXISTS idx_saved_jobs_job_id')
+    c.execute('CREATE UNIQUE INDEX idx_saved_jobs_job_id ON saved_jobs (job_id)')
+    c.execute('''
+        CREATE TABLE IF NOT EXISTS saved_jobs_count (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            total INTEGER NOT NULL
+        )
+    ''')
+    c.execute('INSERT OR REPLACE INTO saved_jobs_count (id, total) SELECT 1, COUNT(*) FROM saved_jobs')
+    c.execute('''
+        CREATE TRIGGER IF NOT EXISTS saved_jobs_count_insert AFTER INSERT ON saved_jobs BEGIN
+            UPDATE saved_jobs_count SET total = total + 1;
+        END
+    ''')
+    c.execute('''
+        CREATE TRIGGER IF NOT EXISTS saved_jobs_count_delete AFTER DELETE ON saved_jobs BEGIN
+            UPDATE saved_jobs_count SET total = total - 1;
+        END
+    ''')
+
+def migrate_resume_profiles(c):
+    """Cache resume skill profiles by file content hash."""
+    columns = {row['name'] for row in c.execute('PRAGMA table_info(resume)')}
+    if 'content_hash' not in columns:
+        c.execute('ALTER TABLE resume ADD COLUMN content_hash TEXT')
+    c.execute('''
+        CREATE TABLE IF NOT EXISTS resume_profiles (
+            content_hash TEXT PRIMARY KEY,
+            version INTEGER,
+            skills TEXT,
+            entities TEXT,
+            created_at REAL
+        )
+    ''')
+
+def migrate_job_skill_profiles(c):
+    """Cache each job's extracted skills and record which resume its match score is for."""
+    columns = {row['name'] for row in c.execute('PRAGMA table_info(jobs)')}
+    if 'skills' not in columns:
+        c.execute('ALTER TABLE jobs ADD COLUMN skills TEXT')
+        c.execute('ALTER TABLE jobs ADD COLUMN skills_version INTEGER')
+        c.execute('ALTER TABLE jobs ADD COLUMN match_profile TEXT')
+    # A new description, such as the full text replacing a listing snippet, needs rescoring
+    c.execute('''
+        CREATE TRIGGER IF NOT EXISTS jobs_skills_reset AFTER UPDATE OF description ON jobs
+        WHEN old.description IS NOT new.description
+        BEGIN
+            UPDATE jobs SET skills = NULL, skills_version = NULL, match_profile = NULL
+            WHERE id = new.id;
+        END
+    ''')
+
+def migrate_watched_query_requests(c):
+    """Record when each watched query was last searched for, so idle ones expire."""
+    columns = {row['name'] for row in c.execute('PRAGMA table_info(watched_queries)')}
+    if 'last_requested_at' not in columns:
+        c.execute('ALTER TABLE watched_queries ADD COLUMN last_requested_at REAL')
+        c.execute('UPDATE watched_queries SET last_requested_at = COALESCE(last_run_at, next_run_at)')
+
+def migrate_sort_tiebreak_indexes(c):
+    """Put id after the sort column in each sort index, so it also supplies the id tiebreak."""
+    for column in ('date_posted', 'title', 'company', 'location', 'match_value'):
+        c.execute(f'DROP INDEX IF EXISTS idx_jobs_sort_{column}')
+        c.execute(f'''
+            CREATE INDEX idx_jobs_sort_{column} ON jobs ({column}, id, platform, location_norm)
+            WHERE dedup_key IS NOT NULL
+        ''')
+    c.execute('ANALYZE jobs')
+
+# Schema version N is reached by applying the first N steps; only ever append
+MIGRATIONS = [
+    migrate_base_tables,
+    migrate_search_columns,
+    migrate_jobs_fts,
+    migrate_hot_query_indexes,
+    migrate_tracker_index,
+    migrate_retained_jobs,
+    migrate_saved_jobs_keyset,
+    migrate_resume_profiles,
+    migrate_job_skill_profiles,
+    migrate_watched_query_requests,
+    migrate_sort_tiebreak_indexes,
+]
+
+def init_db():
+    """Bring the database schema up to date by applying pending MIGRATIONS.
+
+    The applied version is kept in PRAGMA user_version, so an up-to-date
+    database costs one read. Pending steps run in one BEGIN IMMEDIATE
+    transaction: concurrent workers wait for the first one and then find
+    nothing left to do, and a failing step rolls back every step.
+    """
+    global fts_enabled
+    conn = get_conn()
+    try:
+        if conn.execute('PRAGMA user_version').fetchone()[0] < len(MIGRATIONS):
+            conn.execute('BEGIN IMMEDIATE')
+            version = conn.execute('PRAGMA user_version').fetchone()[0]
+            for number, migration in enumerate(MIGRATIONS[version:], version + 1):
+                print(f"Applying schema migration {number}: {migration.__doc__.splitlines()[0]}")
+                migration(conn)
+            conn.execute(f'PRAGMA user_version = {max(version, len(MIGRATIONS))}')
+            conn.commit()
+        fts_enabled = conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'jobs_fts'").fetchone() is not None
+    finally:
+        conn.close()
+
+def job_dedup_key(title, company, location):
+    """Key shared by listings of the same job, whichever URL they came from."""
+    return '\x1f'.join(normalize_query(value) for value in (title, company, location))
+
+def backfill_search_columns(c):
+    """Fill location_norm and dedup_key for rows saved before those columns existed.
+
+    Only the oldest row of each duplicate group gets a dedup_key; the others
+    keep NULL and are left out of search results.
+    """
+    seen = set()
+    updates = []
+    for row in c.execute('SELECT id, title, company, location FROM jobs ORDER BY id').fetchall():
+        key = job_dedup_key(row['title'], row['company'], row['location'])
+        updates.append((normalize_query(row['location']), None if key in seen else key, row['id']))
+        seen.add(key)
+    c.executemany('UPDATE jobs SET location_norm = ?, dedup_key = ? WHERE id = ?', updates)
+
+init_db()
+
+# ALLOWED FILE
+def allowed_file(filename):
+    return '.' in filename and \
+           filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
+
+def allowed_excel_file(filename):
+    return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXCEL_EXTENSIONS
+
+# SAVE LISTINGS
+SAVE_CHUNK_SIZE = 500  # urls per SELECT when looking up the ids of saved listings
+
+def save_listings(listings):
+    """Upsert scraped listings into jobs in one transaction and return their ids.
+
+    Listings are keyed on url. New rows get fetched_at and last_seen_at
+    stamps. A listing already in the table has its date, company info,
+    requirements, description and last_seen_at refreshed, but a description
+    fetched from the posting is never replaced by a listing placeholder. A
+    listing with the title, company and location of a job saved under
+    another url is skipped, though it still refreshes that job's
+    last_seen_at. Returns the ids of the rows written, in listing order.
+    """
+    # Formatted once, as sqlite3's datetime adapter would for every row
+    now = datetime.now().isoformat(' ')
+    rows = {}
+    for job in listings:
+        requirements = job.get('requirements')
+        if isinstance(requirements, str):
+            requirements = requirements.split(',')
+        elif not isinstance(requirements, list):
+            requirements = []
+        rows[job['url']] = (
+            job['title'], job['company'], job.get('company_info', ''), job['location'], job['url'],
+            job['date_posted'], job['platform'], json.dumps(requirements), job.get('description', ''),
+            job.get('match_score', 'N/A'), now, now, normalize_query(job['location']),
+            job_dedup_key(job['title'], job['company'], job['location']), DETAILS_PLACEHOLDER
+        )
+    if not rows:
+        return []
+    conn = get_conn()
+    try:
+        conn.executemany("""
+            INSERT INTO jobs
+            (title, company, company_info, location, url, date_posted, platform,
+            requirements, description, match_score, fetched_at, last_seen_at, location_norm, dedup_key)
+            VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?)
+            ON CONFLICT (url) DO UPDATE SET
+                date_posted = excluded.date_posted,
+                last_seen_at = excluded.last_seen_at,
+                company_info = COALESCE(NULLIF(excluded.company_info, ''), company_info),
+                requirements = CASE WHEN excluded.requirements = '[]' THEN requirements
+                                    ELSE excluded.requirements END,
+                description = CASE WHEN description IS NULL OR description IN ('', ?)
+                                   THEN excluded.description ELSE description END
+            ON CONFLICT DO NOTHING
+        """, rows.values())
+        urls = list(rows)
+        ids = {}
+        for i in range(0, len(urls), SAVE_CHUNK_SIZE):
+            chunk = urls[i:i + SAVE_CHUNK_SIZE]
+            for row in conn.execute(f"SELECT url, id FROM jobs WHERE url IN ({','.join('?' * len(chunk))})", chunk):
+                ids[row['url']] = row['id']
+        # Skipped duplicates still show that the job is listed
+        conn.executemany('UPDATE jobs SET last_seen_at = ? WHERE dedup_key = ?',
+                         [(now, row[-2]) for url, row in rows.items() if url not in ids])
+        conn.commit()
+    finally:
+        conn.close()
+    return [ids[url] for url in urls if url in ids]
+
+# BACKGROUND INGESTION
+def watch_query(conn, keyword, location, platform):
+    """Add a (keyword, location, platform) query to the ingestion queue.
+
+    New queries are due immediately. Each call renews the query for another
+    WATCH_TTL seconds of refreshes. Returns the watched_queries row.
+    """
+    keyword, location = normalize_query(keyword), normalize_query(location)
+    now = time.time()
+    conn.execute('''
+        INSERT INTO watched_queries
+        (keyword, location, platform, interval_seconds, next_run_at, last_requested_at)
+        VALUES (?,?,?,?,?,?)
+        ON CONFLICT (keyword, location, platform) DO UPDATE SET last_requested_at = excluded.last_requested_at
+    ''', (keyword, location, platform, INGEST_INTERVAL, now, now))
+    conn.commit()
+    return conn.execute(
+        'SELECT * FROM watched_queries WHERE keyword = ? AND location = ? AND platform = ?',
+        (keyword, location, platform)
+    ).fetchone()
+
+def claim_due_queries(conn, limit):
+    """Lease up to `limit` due queries and return their ids.
+
+    The lease stops other schedulers sharing the database from picking up
+    the same query. It expires after INGEST_LEASE seconds, so a query whose
+    worker died is retried. Queries nobody has searched for in WATCH_TTL
+    seconds are not refreshed.
+    """
+    now = time.time()
+    rows = conn.execute('''
+        SELECT id FROM watched_queries
+        WHERE next_run_at <= ? AND (leased_until IS NULL OR leased_until < ?)
+          AND last_requested_at >= ?
+        ORDER BY next_run_at LIMIT ?
+    ''', (now, now, now - WATCH_TTL, limit)).fetchall()
+    claimed = []
+    for row in rows:
+        cursor = conn.execute('''
+            UPDATE watched_queries SET leased_until = ?
+            WHERE id = ? AND (leased_until IS NULL OR leased_until < ?)
+        ''', (now + INGEST_LEASE, row['id'], now))
+        if cursor.rowcount:
+            claimed.append(row['id'])
     conn.commit()
+    return claimed
+
+def ingest_query(query_id):
+    """Scrape one watched query into the jobs table and schedule its next run.
+
+    Runs in an ingestion worker thread or process.
+    """
+    conn = get_conn()
+    query = conn.execute('SELECT * FROM watched_queries WHERE id = ?', (query_id,)).fetchone()
+    conn.close()
+    if not query:
+        return 0
+    print(f"Ingesting {query['platform']} jobs for '{query['keyword']}' in '{query['location']}'")
+    jobs, status, error = [], 'ok', None
+    try:
+        jobs = PLATFORM_FETCHERS[query['platform']](query['keyword'], query['location'])
+        if jobs:
+            job_ids = save_listings(jobs)
+            conn = get_conn()
+            try:
+                score_jobs(conn, job_ids)
+            finally:
+                conn.close()
+    except Exception as e:
+        print(f"Error ingesting query {query_id}: {str(e)}")
+        status, error = 'error', str(e)
+    now = time.time()
+    conn = get_conn()
+    conn.execute('''
+        UPDATE watched_queries
+        SET last_run_at = ?, last_status = ?, last_count = ?, last_error = ?,
+            next_run_at = ?, leased_until = NULL
+        WHERE id = ?
+    ''', (now, status, len(jobs), error, now + query['interval_seconds'], query_id))
+    conn.commit()
+    if jobs:
+        # Keep planner statistics current so searches stay on the sort indexes
+        conn.execute('ANALYZE jobs')
     conn.close()
+    return len(jobs)
 
-init_db()
+def query_status(row):
+    return {
+        'status': row['last_status'] or 'pending',
+        'count': row['last_count'] or 0,
+        'last_run_at': row['last_run_at'],
+        'error': row['last_error']
+    }
 
-# ALLOWED FILE
-def allowed_file(filename):
-    return '.' in filename and \
-           filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
+def wait_for_ingestion(conn, queries, timeout):
+    """Wait until every query in `queries` has been ingested at least once.
 
-def allowed_excel_file(filename):
-    return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXCEL_EXTENSIONS
+    Polls the database, so it works whichever process runs the workers. Gives
+    up after `timeout` seconds. Returns the status of each query, keyed by
+    platform.
+    """
+    deadline = time.monotonic() + timeout
+    ids = [query['id'] for query in queries]
+    placeholders = ','.join('?' * len(ids))
+    while True:
+        rows = conn.execute(f'SELECT * FROM watched_queries WHERE id IN ({placeholders})', ids).fetchall()
+        if all(row['last_run_at'] for row in rows) or time.monotonic() >= deadline:
+            return {row['platform']: query_status(row) for row in rows}
+        time.sleep(INGEST_WAIT_POLL)
 
-# SAVE LISTINGS
-def save_listings(listings):
-    conn = get_conn(); c = conn.cursor()
-    for job in listings:
-        # Ensure requirements is a list
-        if isinstance(job['requirements'], str):
-            requirements = job['requirements'].split(',')
-        elif isinstance(job['requirements'], list):
-            requirements = job['requirements']
-        else:
-            requirements = []
-            
-        c.execute(
-            """INSERT OR IGNORE INTO jobs 
-            (title, company, company_info, location, url, date_posted, platform, 
-            requirements, description, match_score, fetched_at) 
-            VALUES (?,?,?,?,?,?,?,?,?,?,?)""",
-            (job['title'], job['company'], job.get('company_info', ''),
-             job['location'], job['url'], job['date_posted'], job['platform'],
-             json.dumps(requirements), job.get('description', ''),
-             job.get('match_score', 'N/A'), datetime.now())
-        )
-    conn.commit(); conn.close()
+def compact_jobs(ttl=JOBS_TTL, batch=COMPACT_BATCH, vacuum_pages=VACUUM_PAGES):
+    """Delete jobs not seen by any scrape for `ttl` seconds and free their pages.
+
+    Jobs referenced by saved_jobs or applications are kept however old they
+    are. Rows go in batches of `batch`, each in its own transaction, so
+    ingestion writers are never locked out for long. Freed pages are then
+    returned with an incremental vacuum; a database created before
+    auto_vacuum was enabled is converted by one full VACUUM first. Returns
+    the number of jobs deleted.
+    """
+    cutoff = (datetime.now() - timedelta(seconds=ttl)).isoformat(' ')
+    conn = get_conn()
+    try:
+        deleted = 0
+        while True:
+            cursor = conn.execute('''
+                DELETE FROM jobs WHERE id IN (
+                    SELECT id FROM jobs
+                    WHERE last_seen_at < ?
+                      AND NOT EXISTS (SELECT 1 FROM saved_jobs WHERE saved_jobs.job_id = jobs.id)
+                      AND NOT EXISTS (SELECT 1 FROM applications WHERE applications.job_id = jobs.id)
+                    LIMIT ?
+                )
+            ''', (cutoff, batch))
+            conn.commit()
+            deleted += cursor.rowcount
+            if cursor.rowcount < batch:
+                break
+        if conn.execute('PRAGMA auto_vacuum').fetchone()[0] != 2:
+            print('Converting the database to incremental auto-vacuum')
+            conn.execute('PRAGMA auto_vacuum = INCREMENTAL')
+            conn.execute('VACUUM')
+        elif conn.execute('PRAGMA freelist_count').fetchone()[0]:
+            # execute() would step the pragma once, freeing a single page
+            conn.executescript(f'PRAGMA incremental_vacuum({int(vacuum_pages)})')
+    finally:
+        conn.close()
+    if deleted:
+        print(f"Compacted jobs: removed {deleted} listings not seen since {cutoff}")
+    return deleted
+
+def prune_watched_queries(ttl=WATCH_TTL):
+    """Stop watching queries nobody has searched for in `ttl` seconds.
+
+    Leased queries are left to their worker. Returns the number removed.
+    """
+    now = time.time()
+    conn = get_conn()
+    try:
+        cursor = conn.execute('''
+            DELETE FROM watched_queries
+            WHERE last_requested_at < ? AND (leased_until IS NULL OR leased_until < ?)
+        ''', (now - ttl, now))
+        conn.commit()
+    finally:
+        conn.close()
+    if cursor.rowcount:
+        print(f"Pruned {cursor.rowcount} watched queries not searched for in {ttl} seconds")
+    return cursor.rowcount
+
+class IngestionScheduler:
+    """Refresh watched queries into the jobs table in the background.
+
+    A daemon thread polls watched_queries for due entries, leases them and
+    runs ingest_query for each one on a pool of `workers` threads or
+    processes, never fewer than one per platform so a first search on every
+    platform is scraped at once. Every `compact_interval` seconds it also
+    runs compact_jobs and prune_watched_queries. wake() makes the scheduler
+    check the queue right away.
+    """
+
+    def __init__(self, workers=INGEST_WORKERS, mode=INGEST_WORKER_MODE,
+                 poll_interval=INGEST_POLL_INTERVAL, compact_interval=COMPACT_INTERVAL):
+        self.workers = max(workers, len(PLATFORM_FETCHERS))
+        self.mode = mode
+        self.poll_interval = poll_interval
+        self.compact_interval = compact_interval
+        self._next_compaction = 0
+        self._executor = None
+        self._thread = None
+        self._running = set()
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+
+    def start(self):
+        with self._lock:
+            if self._thread:
+                return
+            if self.mode == 'process':
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='ingest')
+            self._thread = threading.Thread(target=self._run, name='ingest-scheduler', daemon=True)
+            self._thread.start()
+        print(f"Ingestion scheduler started with {self.workers} {self.mode} workers")
+
+    def wake(self):
+        self._wakeup.set()
+
+    def join(self):
+        """Block until the scheduler thread exits, which it never does on its own."""
+        self._thread.join()
+
+    def _run(self):
+        while True:
+            self._wakeup.wait(self.poll_interval)
+            self._wakeup.clear()
+            try:
+                self._dispatch()
+            except Exception as e:
+                print(f"Error in ingestion scheduler: {str(e)}")
+            if time.monotonic() >= self._next_compaction:
+                self._next_compaction = time.monotonic() + self.compact_interval
+                try:
+                    compact_jobs()
+                    prune_watched_queries()
+                except Exception as e:
+                    print(f"Error compacting jobs: {str(e)}")
+
+    def _dispatch(self):
+        with self._lock:
+            free = self.workers - len(self._running)
+        if free <= 0:
+            return
+        conn = get_conn()
+        try:
+            claimed = claim_due_queries(conn, free)
+        finally:
+            conn.close()
+        for query_id in claimed:
+            with self._lock:
+                self._running.add(query_id)
+            future = self._executor.submit(ingest_query, query_id)
+            future.add_done_callback(lambda f, query_id=query_id: self._finished(query_id, f))
+
+    def _finished(self, query_id, future):
+        with self._lock:
+            self._running.discard(query_id)
+        if future.exception():
+            print(f"Ingestion worker failed for query {query_id}: {future.exception()}")
+        self._wakeup.set()
+
+    def stats(self):
+        with self._lock:
+            running = len(self._running)
+        return {
+            'started': self._thread is not None,
+            'mode': self.mode,
+            'workers': self.workers,
+            'running': running
+        }
+
+ingestion_scheduler = IngestionScheduler()
 
 # APPLY EXTERNAL
 @app.route('/apply_external/<int:job_id>')
@@ -648,6 +2104,202 @@ def apply_external(job_id):
     conn.commit(); conn.close()
     return redirect(row['url'])
 
+# PAGINATION
+def get_page_size():
+    """Read the client-selected page size, clamped to 1..MAX_PAGE_SIZE."""
+    page_size = request.args.get('page_size', DEFAULT_PAGE_SIZE, type=int)
+    return max(1, min(page_size, MAX_PAGE_SIZE))
+
+def encode_cursor(*key):
+    """Encode the sort key of the last row on a page as an opaque cursor."""
+    raw = json.dumps(key).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+def decode_cursor(cursor):
+    """Return the sort key tuple an opaque cursor points after."""
+    raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+    return tuple(json.loads(raw))
+
+# SEARCH SNAPSHOTS
+
+# Filter options and full match counts, which would otherwise scan every job on each search
+search_cache = TTLCache(SEARCH_CACHE_TTL, SEARCH_CACHE_SIZE)
+
+def search_facets(conn, platforms):
+    """Return the locations and platforms of every job on `platforms`, for the filter options.
+
+    Cached in search_cache, so new locations show up within SEARCH_CACHE_TTL seconds.
+    """
+    def fetch():
+        platform_filter = f"platform IN ({','.join('?' * len(platforms))})"
+        facets = {
+            'locations': [row[0] for row in conn.execute(
+                f'SELECT DISTINCT location FROM jobs WHERE {platform_filter} ORDER BY location', platforms)],
+            'platforms': [row[0] for row in conn.execute(
+                f'SELECT DISTINCT platform FROM jobs WHERE {platform_filter} ORDER BY platform', platforms)],
+        }
+        # Returning None leaves platforms with no jobs yet uncached
+        return facets if facets['platforms'] else None
+    return search_cache.get_or_fetch(('facets', tuple(platforms)), fetch) or {'locations': [], 'platforms': []}
+
+# Columns returned for each job; location_norm and dedup_key stay internal
+SEARCH_COLUMNS = ('id', 'title', 'company', 'company_info', 'location', 'url', 'date_posted',
+                  'platform', 'requirements', 'description', 'match_score', 'fetched_at', 'last_seen_at')
+
+# FTS5 query syntax; keywords using any of it are passed to MATCH unchanged
+FTS_SYNTAX = re.compile(r'["*()^:]|\b(?:AND|OR|NOT|NEAR)\b')
+
+def fts_query(conn, keyword):
+    """Translate a search keyword into an FTS5 MATCH expression.
+
+    Plain keywords become a phrase whose last word is a prefix, so
+    'python dev' matches 'Python Developer'. Keywords ending in punctuation
+    are matched exactly, so 'c++' does not match every word starting with c.
+    Keywords written in FTS5 syntax (phrases, prefixes, AND/OR/NOT, NEAR,
+    column filters) are used as they are, unless SQLite rejects them, in
+    which case they are quoted too.
+    """
+    phrase = '"' + keyword.replace('"', '""') + '"'
+    if keyword[-1:].isalnum():
+        phrase += ' *'
+    if not FTS_SYNTAX.search(keyword):
+        return phrase
+    try:
+        conn.execute('SELECT 1 FROM jobs_fts WHERE jobs_fts MATCH ? LIMIT 1', (keyword,)).fetchall()
+    except sqlite3.OperationalError as e:
+        print(f"Invalid full-text query {keyword!r} ({str(e)}), searching for it as a phrase")
+        return phrase
+    return keyword
+
+def search_filter(conn, keyword, location, platforms=None):
+    """Return (source, where, params) for a search over the jobs table.
+
+    The keyword is matched through the jobs_fts index, which `source` joins
+    in, or as a substring of title, company or description when FTS5 is not
+    available. Any of the comma-separated locations matches location_norm as
+    a substring. Rows without a dedup_key are duplicates of an older
+    listing. Sort indexes end in (id, platform, location_norm), so a sorted
+    search walks one in order, tests the filters on the index entries and
+    stops at the first SEARCH_MAX_RESULTS matches.
+    """
+    source = 'jobs'
+    clauses = ['jobs.dedup_key IS NOT NULL']
+    params = []
+    if keyword and fts_enabled:
+        source = 'jobs_fts JOIN jobs ON jobs.id = jobs_fts.rowid'
+        clauses.append('jobs_fts MATCH ?')
+        params.append(fts_query(conn, keyword))
+    elif keyword:
+        clauses.append('(instr(lower(jobs.title), ?) OR instr(lower(jobs.company), ?) '
+                       'OR instr(lower(jobs.description), ?))')
+        params.extend([keyword.lower()] * 3)
+    if platforms is not None:
+        # The unary + keeps the planner off idx_jobs_search, whose matches would all be sorted
+        clauses.append(f"+jobs.platform IN ({','.join('?' * len(platforms))})")
+        params.extend(platforms)
+    locations = [normalize_query(loc) for loc in location.split(',') if loc.strip()]
+    if locations:
+        clauses.append('(' + ' OR '.join(['instr(jobs.location_norm, ?)'] * len(locations)) + ')')
+        params.extend(locations)
+    return source, ' AND '.join(clauses), params
+
+def search_order(sort_by, sort_order, source='jobs'):
+    """Return the sort terms for a sort_by/sort_order pair as (expression, direction) pairs.
+
+    Ties are broken by id. 'relevance' sorts by BM25 rank and needs the
+    jobs_fts join in `source`; without it, it falls back to date_posted.
+    """
+    direction = 'DESC' if sort_order.lower() == 'desc' else 'ASC'
+    if sort_by == 'relevance' and 'jobs_fts' in source:
+        # rank is lower for better matches, so 'desc' (best first) sorts it ascending
+        return [('jobs_fts.rank', 'ASC' if direction == 'DESC' else 'DESC'), ('jobs.id', direction)]
+    if sort_by == 'match_score' and direction == 'ASC':
+        # Unscored jobs (NULL) go last in either direction; descending order already puts them there
+        return [('jobs.match_value', 'ASC NULLS LAST'), ('jobs.id', 'ASC')]
+    return [(f"jobs.{SEARCH_SORT_COLUMNS.get(sort_by, 'date_posted')}", direction), ('jobs.id', direction)]
+
+def create_snapshot(conn, source, where, params, order, meta):
+    """Store the ids of an ordered search result set. Returns (snapshot_id, total).
+
+    The top SEARCH_MAX_RESULTS ids are numbered and copied with one
+    INSERT ... SELECT, so no job rows pass through Python. Each id is stored
+    with its 1-based position, so any page can be read back with a keyset
+    query on (snapshot_id, position). `total` is the snapshot size unless the
+    snapshot is full; only then are all matches counted, and that count is
+    reused from search_cache for SEARCH_CACHE_TTL seconds. Expired snapshots
+    are removed first.
+    """
+    snapshot_id = uuid.uuid4().hex
+    now = time.time()
+    conn.execute('''
+        DELETE FROM search_snapshot_rows WHERE snapshot_id IN
+            (SELECT id FROM search_snapshots WHERE created_at < ?)
+    ''', (now - SNAPSHOT_TTL,))
+    conn.execute('DELETE FROM search_snapshots WHERE created_at < ?', (now - SNAPSHOT_TTL,))
+    # The inner query returns its sort keys so the outer one can number rows in the same order
+    keys = ', '.join(f'{expression} AS k{i}' for i, (expression, _) in enumerate(order))
+    inner_order = ', '.join(f'{expression} {direction}' for expression, direction in order)
+    outer_order = ', '.join(f'k{i} {direction}' for i, (_, direction) in enumerate(order))
+    total = conn.execute(f'''
+        INSERT INTO search_snapshot_rows (snapshot_id, position, job_id)
+        SELECT ?, row_number() OVER (ORDER BY {outer_order}), id
+        FROM (SELECT jobs.id AS id, {keys} FROM {source} WHERE {where} ORDER BY {inner_order} LIMIT ?)
+    ''', [snapshot_id] + params + [SEARCH_MAX_RESULTS]).rowcount
+    if total >= SEARCH_MAX_RESULTS:
+        total = search_cache.get_or_fetch(
+            ('count', source, where, tuple(params)),
+            lambda: conn.execute(f'SELECT COUNT(*) FROM {source} WHERE {where}', params).fetchone()[0]
+        )
+    conn.execute(
+        'INSERT INTO search_snapshots (id, meta, total, created_at) VALUES (?,?,?,?)',
+        (snapshot_id, json.dumps(meta), total, now)
+    )
+    conn.commit()
+    return snapshot_id, total
+
+def snapshot_jobs(conn, snapshot_id, after, limit):
+    """Return up to `limit` jobs of a snapshot, following position `after`."""
+    columns = ', '.join(f'jobs.{column}' for column in SEARCH_COLUMNS)
+    rows = conn.execute(f'''
+        SELECT {columns} FROM search_snapshot_rows
+        JOIN jobs ON jobs.id = search_snapshot_rows.job_id
+        WHERE snapshot_id = ? AND position > ?
+        ORDER BY position LIMIT ?
+    ''', (snapshot_id, after, limit)).fetchall()
+    return [dict(row) for row in rows]
+
+def read_snapshot_page(conn, snapshot_id, after, page_size):
+    """Return (meta, total, jobs) for the page following position `after`.
+
+    Returns None if the snapshot does not exist or has expired.
+    """
+    snapshot = conn.execute(
+        'SELECT meta, total FROM search_snapshots WHERE id = ? AND created_at >= ?',
+        (snapshot_id, time.time() - SNAPSHOT_TTL)
+    ).fetchone()
+    if not snapshot:
+        return None
+    return json.loads(snapshot['meta']), snapshot['total'], snapshot_jobs(conn, snapshot_id, after, page_size)
+
+def snapshot_response(snapshot_id, meta, total, jobs, after, page_size):
+    last_position = after + len(jobs)
+    # Only the first SEARCH_MAX_RESULTS matches can be paged through
+    size = min(total, SEARCH_MAX_RESULTS)
+    return {
+        'jobs': jobs,
+        'total': total,
+        'pages': (size + page_size - 1) // page_size,
+        'current_page': after // page_size + 1,
+        'page_size': page_size,
+        'snapshot': snapshot_id,
+        'cursor': encode_cursor(snapshot_id, last_position) if last_position < size else None,
+        'locations': meta['locations'],
+        'platforms': meta['platforms'],
+        'sort_by': meta['sort_by'],
+        'sort_order': meta['sort_order'],
+        'platform_status': meta['platform_status']
+    }
+
 @app.route('/api/search', methods=['GET', 'POST'])
 def search():
     print("\n=== Search Request ===")
@@ -658,126 +2310,70 @@ def search():
     keyword = request.args.get('keyword', '')
     location = request.args.get('location', '')
     platform = request.args.get('platform', '')
-    page = int(request.args.get('page', 1))
+    page = max(1, int(request.args.get('page', 1)))
+    page_size = get_page_size()
     sort_by = request.args.get('sort_by', 'date_posted')  # New parameter for sorting
     sort_order = request.args.get('sort_order', 'desc')   # New parameter for sort order
+    snapshot_id = request.args.get('snapshot', '')
+    cursor = request.args.get('cursor', '')
     
     print(f"Search parameters - Keyword: {keyword}, Location: {location}, Platform: {platform}, Sort: {sort_by} {sort_order}")
     
+    after = (page - 1) * page_size
+    if cursor:
+        try:
+            snapshot_id, after = decode_cursor(cursor)
+            after = int(after)
+            if not isinstance(snapshot_id, str):
+                raise TypeError(snapshot_id)
+        except (ValueError, TypeError):
+            return jsonify({'status': 'error', 'message': 'Invalid cursor'}), 400
+    
     try:
-        # Clear old jobs and fetch new ones
         conn = get_conn()
-        conn.execute('DELETE FROM jobs')
-        conn.commit()
+        # Later pages are read from the snapshot made by the first search
+        if snapshot_id:
+            snapshot = read_snapshot_page(conn, snapshot_id, after, page_size)
+            if snapshot:
+                conn.close()
+                detail_prefetcher.prefetch(snapshot[2])
+                return jsonify(snapshot_response(snapshot_id, *snapshot, after, page_size))
+            print(f"Snapshot {snapshot_id} has expired, searching again")
         
-        # Fetch jobs based on platform selection
-        jobs = []
+        # Scraping runs in the ingestion workers. The search watches the query
+        # on each platform and only waits for platforms never ingested before.
         if platform:
-            if platform == 'LinkedIn':
-                jobs.extend(fetch_linkedin_jobs(keyword, location))
-            elif platform == 'Indeed':
-                jobs.extend(fetch_indeed_jobs(keyword, location))
-            elif platform == 'ZipRecruiter':
-                jobs.extend(fetch_ziprecruiter_jobs(keyword, location))
-        else:
-            # Fetch from all platforms if no specific platform is selected
-            jobs.extend(fetch_linkedin_jobs(keyword, location))
-            try:
-                jobs.extend(fetch_indeed_jobs(keyword, location))
-            except Exception as e:
-                print(f"Error fetching Indeed jobs: {str(e)}")
-            try:
-                jobs.extend(fetch_ziprecruiter_jobs(keyword, location))
-            except Exception as e:
-                print(f"Error fetching ZipRecruiter jobs: {str(e)}")
-        
-        print(f"DEBUG: Jobs fetched: {len(jobs)}")
-        # Save the jobs to database
-        if jobs:
-            save_listings(jobs)
-        
-        # Get all jobs from database with sorting
-        sort_column = {
-            'date_posted': 'date_posted',
-            'title': 'title',
-            'company': 'company',
-            'location': 'location',
-            'match_score': 'match_score'
-        }.get(sort_by, 'date_posted')
-        
-        sort_direction = 'DESC' if sort_order.lower() == 'desc' else 'ASC'
-        
-        # Handle special case for match_score which might be 'N/A'
-        if sort_by == 'match_score':
-            query = f'''
-                SELECT * FROM jobs 
-                ORDER BY 
-                    CASE 
-                        WHEN match_score = 'N/A' THEN 1 
-                        ELSE 0 
-                    END,
-                    CAST(REPLACE(match_score, '%', '') AS FLOAT) {sort_direction}
-            '''
+            platforms = [platform] if platform in PLATFORM_FETCHERS else []
         else:
-            query = f'SELECT * FROM jobs ORDER BY {sort_column} {sort_direction}'
-            
-        jobs = conn.execute(query).fetchall()
-        print(f"DEBUG: Jobs in DB after save: {len(jobs)}")
-        conn.close()
+            platforms = list(PLATFORM_FETCHERS)
+        queries = [watch_query(conn, keyword, location, p) for p in platforms]
+        if INGEST_ENABLED:
+            ingestion_scheduler.start()
+            ingestion_scheduler.wake()
+        platform_status = wait_for_ingestion(conn, queries, PLATFORM_DEADLINE) if queries else {}
         
-        # Filter jobs based on search criteria with more flexible matching
-        filtered_jobs = []
-        for job in jobs:
-            # More flexible keyword matching
-            keyword_match = (
-                not keyword or
-                keyword.lower() in job['title'].lower() or
-                keyword.lower() in job['company'].lower() or
-                keyword.lower() in job['description'].lower()
-            )
-            # More flexible location matching
-            if ',' in location:
-                location_list = [loc.strip().lower() for loc in location.split(',') if loc.strip()]
-            else:
-                location_list = [location.lower()] if location else []
-            location_match = any(loc in job['location'].lower() for loc in location_list)
-            # Platform matching
-            platform_match = not platform or platform == job['platform']
-            if keyword_match and location_match and platform_match:
-                filtered_jobs.append(dict(job))
-        print(f"DEBUG: Filtered jobs: {len(filtered_jobs)}")
-        # Deduplicate jobs by title, company, and location
-        seen = set()
-        unique_jobs = []
-        for job in filtered_jobs:
-            key = (job['title'].lower(), job['company'].lower(), job['location'].lower())
-            if key not in seen:
-                seen.add(key)
-                unique_jobs.append(job)
-        filtered_jobs = unique_jobs
-        print(f"DEBUG: Unique jobs after deduplication: {len(filtered_jobs)}")
-        # Pagination
-        total_jobs = len(filtered_jobs)
-        jobs_per_page = 5
-        total_pages = (total_jobs + jobs_per_page - 1) // jobs_per_page
-        start_idx = (page - 1) * jobs_per_page
-        end_idx = start_idx + jobs_per_page
-        paginated_jobs = filtered_jobs[start_idx:end_idx]
-        print(f"DEBUG: Paginated jobs: {len(paginated_jobs)}")
-        # Get unique locations and platforms for filters
-        locations = sorted(list(set(job['location'] for job in jobs)))
-        platforms = sorted(list(set(job['platform'] for job in jobs)))
-        response_data = {
-            'jobs': paginated_jobs,
-            'total': total_jobs,
-            'pages': total_pages,
-            'current_page': page,
-            'locations': locations,
-            'platforms': platforms,
+        source, where, params = search_filter(conn, keyword, location, platforms if platform else None)
+        # Filter options cover every job on the searched platforms
+        meta = {
+            **search_facets(conn, platforms),
             'sort_by': sort_by,
-            'sort_order': sort_order
+            'sort_order': sort_order,
+            'platform_status': platform_status
         }
-        return jsonify(response_data)
+        # Scores must be current before the snapshot fixes the match_score order
+        scored = score_search_results(conn, source, where, params)
+        if scored:
+            print(f"Scored {scored} jobs against the resume")
+        order = search_order(sort_by, sort_order, source)
+        snapshot_id, total = create_snapshot(conn, source, where, params, order, meta)
+        print(f"DEBUG: Matching jobs: {total}")
+        paginated_jobs = snapshot_jobs(conn, snapshot_id, after, page_size)
+        top_jobs = paginated_jobs if after == 0 and page_size >= PREFETCH_TOP_N else \
+            snapshot_jobs(conn, snapshot_id, 0, PREFETCH_TOP_N)
+        conn.close()
+        # Load details for the top results and this page before anyone opens them
+        detail_prefetcher.prefetch(top_jobs[:PREFETCH_TOP_N] + paginated_jobs)
+        return jsonify(snapshot_response(snapshot_id, meta, total, paginated_jobs, after, page_size))
         
     except Exception as e:
         print(f"Error in search function: {str(e)}")
@@ -788,10 +2384,14 @@ def search():
             'total': 0,
             'pages': 0,
             'current_page': page,
+            'page_size': page_size,
+            'snapshot': None,
+            'cursor': None,
             'locations': [],
             'platforms': [],
             'sort_by': sort_by,
-            'sort_order': sort_order
+            'sort_order': sort_order,
+            'platform_status': {}
         }), 500
 
 @app.route('/api/db-status', methods=['GET'])
@@ -830,63 +2430,131 @@ def db_status():
             'message': str(e)
         }), 500
 
+@app.route('/api/metrics', methods=['GET'])
+def metrics():
+    conn = get_conn()
+    queue = conn.execute('''
+        SELECT COUNT(*) AS watched,
+               SUM(next_run_at <= ?) AS due,
+               SUM(leased_until > ?) AS leased
+        FROM watched_queries
+    ''', (time.time(), time.time())).fetchone()
+    conn.close()
+    ingestion = ingestion_scheduler.stats()
+    ingestion.update({key: queue[key] or 0 for key in queue.keys()})
+    return jsonify({
+        'scrape_cache': scrape_cache.stats(),
+        'search_cache': search_cache.stats(),
+        'sessions': session_pool.stats(),
+        'detail_prefetch': detail_prefetcher.stats(),
+        'detail_cache': detail_cache.stats(),
+        'db_pool': db_pool.stats(),
+        'ingestion': ingestion
+    })
+
 @app.route('/api/tracker', methods=['GET'])
 def tracker():
+    """Page through tracked applications.
+
+    Query parameters: page, limit, status (comma-separated, 'all' for every
+    status, defaults to Applied), sort_by (a TRACKER_SORT_COLUMNS key) and
+    sort_order. status_counts covers all applications, whatever the filter.
+    """
     try:
+        page = max(1, request.args.get('page', 1, type=int))
+        limit = max(1, min(request.args.get('limit', TRACKER_PAGE_SIZE, type=int), MAX_PAGE_SIZE))
+        statuses = [s.strip() for s in request.args.get('status', TRACKER_DEFAULT_STATUS).split(',') if s.strip()]
+        sort_column = TRACKER_SORT_COLUMNS.get(request.args.get('sort_by'), 'a.applied_at')
+        direction = 'ASC' if request.args.get('sort_order', 'desc').lower() == 'asc' else 'DESC'
+
+        where, params = '', []
+        if statuses and 'all' not in (s.lower() for s in statuses):
+            where = f"WHERE a.status IN ({', '.join('?' * len(statuses))})"
+            params = statuses
+
         conn = get_conn()
-        print('DEBUG: Checking database connection...')
-        print('DEBUG: Database path:', DB_PATH)
-        # First check if we have any applications
-        cursor = conn.cursor()
-        cursor.execute('SELECT COUNT(*) FROM applications')
-        count = cursor.fetchone()[0]
-        print(f'DEBUG: Total applications in database: {count}')
-        # Get all applications with their details
-        apps = conn.execute('''
-            SELECT a.*, j.title as job_title 
-            FROM applications a 
-            LEFT JOIN jobs j ON a.job_id = j.id 
-            WHERE a.status = "Applied"
-        ''').fetchall()
-        print(f'DEBUG: Found {len(apps)} applied applications')
-        for app in apps:
-            print(f'DEBUG: Application: {dict(app)}')
-        def safe_dict(row):
-            d = dict(row)
-            for k, v in d.items():
-                if v is None:
-                    d[k] = ''
-            return d
-        conn.close()
-        return jsonify({'applications': [safe_dict(app) for app in apps]})
+        try:
+            status_counts = {row['status'] or '': row['count'] for row in conn.execute(
+                'SELECT status, COUNT(*) AS count FROM applications GROUP BY status')}
+            total = conn.execute(f'SELECT COUNT(*) FROM applications a {where}', params).fetchone()[0]
+            pages = (total + limit - 1) // limit
+            page = min(page, pages) if pages > 0 else 1
+            # a.id breaks ties in the same direction, so (status, applied_at) index order is kept
+            apps = conn.execute(f'''
+                SELECT a.*, j.title AS job_title
+                FROM applications a
+                LEFT JOIN jobs j ON a.job_id = j.id
+                {where}
+                ORDER BY {sort_column} {direction}, a.id {direction}
+                LIMIT ? OFFSET ?
+            ''', params + [limit, (page - 1) * limit]).fetchall()
+        finally:
+            conn.close()
+        applications = [{k: '' if v is None else v for k, v in dict(row).items()} for row in apps]
+        return jsonify({
+            'applications': applications,
+            'total': total,
+            'pages': pages,
+            'current_page': page,
+            'status_counts': status_counts
+        })
     except Exception as e:
-        import traceback
         print(f"Error in /api/tracker: {str(e)}")
-        traceback.print_exc()
         return jsonify({'applications': [], 'error': str(e)}), 500
 
 @app.route('/api/saved_jobs', methods=['GET'])
 def saved_jobs():
+    """Page through saved jobs, most recently saved first.
+
+    Pass the returned cursor back to get the next page; each page is then a
+    range scan of the saved_at index whatever its depth. Without a cursor,
+    `page` is skipped to with OFFSET. The total comes from saved_jobs_count.
+    """
+    page = max(1, request.args.get('page', 1, type=int))
+    per_page = get_page_size()
+    cursor = request.args.get('cursor', '')
+    after = None
+    if cursor:
+        try:
+            saved_at, saved_id = decode_cursor(cursor)
+            if not isinstance(saved_at, str) or type(saved_id) is not int:
+                raise TypeError(cursor)
+        except (ValueError, TypeError):
+            return jsonify({'status': 'error', 'message': 'Invalid cursor'}), 400
+        after = (saved_at, saved_id)
     conn = get_conn()
     try:
-        page = request.args.get('page', 1, type=int)
-        per_page = PER_PAGE
-        all_jobs = conn.execute('''
-            SELECT j.*, sj.saved_at 
-            FROM jobs j 
-            JOIN saved_jobs sj ON j.id = sj.job_id 
-            ORDER BY sj.saved_at DESC
-        ''').fetchall()
-        total = len(all_jobs)
+        total = conn.execute('SELECT total FROM saved_jobs_count').fetchone()[0]
         pages = (total + per_page - 1) // per_page
-        page = max(1, min(page, pages)) if pages > 0 else 1
-        jobs = all_jobs[(page-1)*per_page : page*per_page]
-        jobs = [dict(job) for job in jobs]
+        if after:
+            where, params = 'WHERE (sj.saved_at, sj.id) < (?, ?)', list(after)
+        else:
+            page = min(page, pages) if pages > 0 else 1
+            where, params = '', []
+        columns = ', '.join(f'j.{column}' for column in SEARCH_COLUMNS)
+        rows = conn.execute(f'''
+            SELECT {columns}, sj.saved_at, sj.id AS saved_id
+            FROM saved_jobs sj
+            JOIN jobs j ON j.id = sj.job_id
+            {where}
+            ORDER BY sj.saved_at DESC, sj.id DESC
+            LIMIT ? OFFSET ?
+        ''', params + [per_page + 1, 0 if after else (page - 1) * per_page]).fetchall()
+        # One extra row is read to tell whether another page follows
+        jobs = [dict(row) for row in rows[:per_page]]
+        next_cursor = None
+        if len(rows) > per_page:
+            last = jobs[-1]
+            next_cursor = encode_cursor(last['saved_at'], last['saved_id'])
+        for job in jobs:
+            del job['saved_id']
         return jsonify({
             'saved_jobs': jobs,
             'total': total,
             'pages': pages,
-            'current_page': page
+            'current_page': page,
+            'page_size': per_page,
+            'cursor': next_cursor
         })
     finally:
         conn.close()
@@ -922,11 +2590,12 @@ def details():
                         filename = secure_filename(file.filename)
                         file_path = os.path.join(app.config['UPLOAD_FOLDER'], filename)
                         file.save(file_path)
-                        conn = get_conn()
-                        conn.execute('INSERT INTO resume (filename, uploaded_at) VALUES (?,?)',
-                                   (filename, datetime.now().strftime('%Y-%m-%d %H:%M')))
+                        # Extract the skill profile now, so scoring never has to parse the file
+                        content_hash = store_resume_profile(conn, file_path)
+                        conn.execute('INSERT INTO resume (filename, uploaded_at, content_hash) VALUES (?,?,?)',
+                                   (filename, datetime.now().strftime('%Y-%m-%d %H:%M'), content_hash))
                         conn.commit()
-                        conn.close()
+                        rescore_jobs_in_background()
                         resume = {'filename': filename, 'uploaded_at': datetime.now().strftime('%Y-%m-%d %H:%M')}
                 except Exception as e:
                     error = f'Error uploading file: {str(e)}'
@@ -948,8 +2617,12 @@ def delete_resume():
         if os.path.exists(file_path):
             os.remove(file_path)
         
-        # Delete from database
+        # Delete from database, with any profile no longer used by a resume
         conn.execute('DELETE FROM resume WHERE filename = ?', (filename,))
+        conn.execute('''
+            DELETE FROM resume_profiles WHERE content_hash NOT IN
+                (SELECT content_hash FROM resume WHERE content_hash IS NOT NULL)
+        ''')
         conn.commit()
     
     conn.close()
@@ -973,41 +2646,23 @@ def job_details(job_id):
     """Get detailed information about a specific job."""
     try:
         conn = get_conn()
-        job = conn.execute('SELECT * FROM jobs WHERE id = ?', (job_id,)).fetchone()
+        job = conn.execute(f"SELECT {', '.join(SEARCH_COLUMNS)} FROM jobs WHERE id = ?", (job_id,)).fetchone()
         if not job:
             return jsonify({'error': 'Job not found'}), 404
 
         job = dict(job)
         
         # Only fetch details if they haven't been fetched before
-        if not job.get('description') or job['description'] == 'Click "Details" to view full description':
+        if needs_details(job):
             try:
-                details = fetch_job_details(job['url'])
+                # Joins the prefetch for this job if one is already running
+                details = detail_prefetcher.get(job_id, job['url'])
                 job.update(details)
-                
-                # Update the database with the fetched details
-                conn.execute('''
-                    UPDATE jobs 
-                    SET description = ?, requirements = ?
-                    WHERE id = ?
-                ''', (
-                    job['description'],
-                    json.dumps(job.get('requirements', [])),
-                    job_id
-                ))
-                conn.commit()
             except Exception as e:
                 print(f"Error fetching job details: {str(e)}")
                 return jsonify({"error": str(e)}), 500
         
-        # Get resume skills
-        resume_skills = {}
-        resume = conn.execute('SELECT * FROM resume ORDER BY uploaded_at DESC LIMIT 1').fetchone()
-        if resume:
-            resume_path = os.path.join(app.config['UPLOAD_FOLDER'], resume['filename'])
-            if os.path.exists(resume_path):
-                resume_text = extract_text_from_file(resume_path)
-                resume_skills, _ = extract_skills_from_text(resume_text)
+        resume_skills = get_resume_skills(conn)
         
         # Calculate match percentage
         match_percentage, matched_skills, missing_skills = calculate_job_match(
@@ -1015,6 +2670,7 @@ def job_details(job_id):
         )
         
         # Add match information to job details
+        job['match_score'] = store_match_score(conn, job_id, match_percentage)
         job['match_percentage'] = round(match_percentage, 1)
         job['matched_skills'] = matched_skills
         job['missing_skills'] = missing_skills
@@ -1105,21 +2761,18 @@ def save_job(job_id):
     conn = get_conn()
     try:
         if request.method == 'POST':
-            # Check if already saved
-            exists = conn.execute('SELECT 1 FROM saved_jobs WHERE job_id = ?', (job_id,)).fetchone()
-            if exists:
-                return jsonify({'status': 'already_saved'})
-            conn.execute('INSERT INTO saved_jobs (job_id, saved_at) VALUES (?, ?)', (job_id, datetime.now()))
+            # The unique job_id index turns a second save into a no-op
+            cursor = conn.execute('''
+                INSERT INTO saved_jobs (job_id, saved_at) VALUES (?, ?)
+                ON CONFLICT (job_id) DO NOTHING
+            ''', (job_id, datetime.now()))
             conn.commit()
-            return jsonify({'status': 'success'})
+            return jsonify({'status': 'success' if cursor.rowcount else 'already_saved'})
         elif request.method == 'DELETE':
             # Unsave job
-            exists = conn.execute('SELECT 1 FROM saved_jobs WHERE job_id = ?', (job_id,)).fetchone()
-            if not exists:
-                return jsonify({'status': 'not_saved'})
-            conn.execute('DELETE FROM saved_jobs WHERE job_id = ?', (job_id,))
+            cursor = conn.execute('DELETE FROM saved_jobs WHERE job_id = ?', (job_id,))
             conn.commit()
-            return jsonify({'status': 'success'})
+            return jsonify({'status': 'success' if cursor.rowcount else 'not_saved'})
     except Exception as e:
         return jsonify({'status': 'error', 'message': str(e)}), 500
     finally:
@@ -1135,13 +2788,29 @@ try:
 except LookupError:
     nltk.download('stopwords')
 
-# Load spaCy model
-try:
-    nlp = spacy.load('en_core_web_sm')
-except OSError:
-    import subprocess
-    subprocess.run(['python', '-m', 'spacy', 'download', 'en_core_web_sm'])
-    nlp = spacy.load('en_core_web_sm')
+# spaCy model, loaded by get_nlp on first use
+_nlp = None
+_nlp_lock = threading.Lock()
+
+def get_nlp():
+    """Return the NER-only spaCy pipeline, loading it on first use.
+
+    Workers that never extract entities never pay for the model.
+    """
+    global _nlp
+    if _nlp is None:
+        with _nlp_lock:
+            if _nlp is None:
+                try:
+                    _nlp = spacy.load(SPACY_MODEL, exclude=SPACY_EXCLUDE)
+                except OSError:
+                    import subprocess
+                    subprocess.run(['python', '-m', 'spacy', 'download', SPACY_MODEL])
+                    _nlp = spacy.load(SPACY_MODEL, exclude=SPACY_EXCLUDE)
+    return _nlp
+
+def doc_entities(doc):
+    return [ent.text.lower() for ent in doc.ents if ent.label_ in SPACY_ENTITY_LABELS]
 
 # Common technical skills and keywords
 TECHNICAL_SKILLS = {
@@ -1222,6 +2891,190 @@ TECHNICAL_SKILLS = {
     ]
 }
 
+# SKILL MATCHING
+# Other spellings of known skills, matched as the skill they map to
+SKILL_ALIASES = {
+    'js': 'javascript',
+    'ts': 'typescript',
+    'golang': 'go',
+    'cpp': 'c++',
+    'csharp': 'c#',
+    'objective c': 'objective-c',
+    'nodejs': 'node.js',
+    'reactjs': 'react',
+    'react.js': 'react',
+    'vuejs': 'vue',
+    'vue.js': 'vue',
+    'angularjs': 'angular',
+    'nextjs': 'next.js',
+    'postgres': 'postgresql',
+    'mongo': 'mongodb',
+    'k8s': 'kubernetes',
+    'amazon web services': 'aws',
+    'google cloud': 'gcp',
+    'google cloud platform': 'gcp',
+    'sklearn': 'scikit-learn',
+    'ml': 'machine learning',
+    'cicd': 'ci/cd',
+    'restful api': 'rest api',
+    'powerbi': 'power bi',
+    'spark': 'apache spark',
+}
+
+class SkillMatcher:
+    """Aho-Corasick automaton over known skills and their aliases.
+
+    find() reports every skill in a text in one pass, however many skills
+    there are. With word_boundary, a skill only counts as a whole word, so
+    'r' is not found in 'react'. Without it, matching keeps the substring
+    semantics extraction always had: a skill anywhere inside a phrase, or a
+    phrase anywhere inside a skill name.
+    """
+
+    def __init__(self, skills, aliases=None, word_boundary=True):
+        self.word_boundary = word_boundary
+        patterns = {skill.lower(): skill for skill in skills}
+        for alias, skill in (aliases or {}).items():
+            patterns.setdefault(alias.lower(), skill)
+        self._goto = [{}]
+        self._out = [[]]
+        for pattern, skill in patterns.items():
+            state = 0
+            for ch in pattern:
+                if ch not in self._goto[state]:
+                    self._goto[state][ch] = len(self._goto)
+                    self._goto.append({})
+                    self._out.append([])
+                state = self._goto[state][ch]
+            self._out[state].append((len(pattern), skill))
+        # Failure links, breadth first, so each state inherits the matches of its longest suffix
+        self._fail = [0] * len(self._goto)
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, child in self._goto[state].items():
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(ch, 0)
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+                queue.append(child)
+        # Every substring of every skill name, for phrases that are part of a skill
+        self._substrings = {}
+        if not word_boundary:
+            for skill in set(patterns.values()):
+                name = skill.lower()
+                for i in range(len(name)):
+                    for j in range(i + 1, len(name) + 1):
+                        self._substrings.setdefault(name[i:j], set()).add(skill)
+
+    def find(self, text):
+        """Return the set of known skills that occur in lowercased `text`."""
+        goto, fail, out = self._goto, self._fail, self._out
+        found = set()
+        state = 0
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for length, skill in out[state]:
+                if self.word_boundary and not (
+                        (i < length or not is_word_char(text[i - length])) and
+                        (i + 1 == len(text) or not is_word_char(text[i + 1]))):
+                    continue
+                found.add(skill)
+        return found
+
+    def match_phrases(self, phrases):
+        """Return the set of known skills matching any of `phrases`."""
+        found = self.find('\n'.join(phrases))
+        if not self.word_boundary:
+            for phrase in phrases:
+                found.update(self._substrings.get(phrase, ()))
+        return found
+
+def is_word_char(ch):
+    return ch.isalnum() or ch == '_'
+
+# Each skill's category; a skill listed under several keeps the first
+SKILL_CATEGORIES = {}
+for category, skills in TECHNICAL_SKILLS.items():
+    for skill in skills:
+        SKILL_CATEGORIES.setdefault(skill.lower(), category)
+
+def build_skill_matcher(mode=SKILL_MATCH_MODE):
+    """Build the SkillMatcher for a SKILL_MATCH_MODE.
+
+    Substring mode reproduces the old matching exactly, so it leaves out
+    SKILL_ALIASES: short aliases like 'ts' or 'ml' would otherwise be found
+    inside 'products' or 'html'.
+    """
+    if mode == 'substring':
+        return SkillMatcher(SKILL_CATEGORIES, word_boundary=False)
+    return SkillMatcher(SKILL_CATEGORIES, SKILL_ALIASES)
+
+skill_matcher = build_skill_matcher()
+
+# Sentences sample job descriptions for benchmark_skills are made of
+SAMPLE_DESCRIPTION_SENTENCES = [
+    'Experience with {0} and {1} is required',
+    'Must have knowledge of {0}',
+    'You will be responsible for building {0} services on {1}',
+    'Proficient in {0}, {1} and {2}',
+    'Strong {0} skills',
+    'Working with {0} in a fast-paced team',
+    'Familiar with {0} or similar tools',
+    'Our office has great coffee and a friendly team',
+    'We offer flexible hours and a generous learning budget',
+]
+
+def benchmark_skills(descriptions=200, sentences=120, seed=0):
+    """Time skill matching on long job descriptions, old nested loops against SkillMatcher.
+
+    Builds `descriptions` seeded sample descriptions of `sentences`
+    sentences each, extracts their candidate phrases once, then times only
+    the matching step. Also checks that substring mode finds exactly what
+    the nested loops found.
+    """
+    def nested_loops(found_skills):
+        matched = {context: set() for context in found_skills}
+        for category, skills in TECHNICAL_SKILLS.items():
+            for skill in skills:
+                skill_lower = skill.lower()
+                for context in found_skills:
+                    for extracted_skill in found_skills[context]:
+                        if (skill_lower in extracted_skill.lower() or
+                                extracted_skill.lower() in skill_lower):
+                            matched[context].add(skill)
+        return matched
+
+    rng = random.Random(seed)
+    names = list(SKILL_CATEGORIES) + list(SKILL_ALIASES)
+    phrases = []
+    for _ in range(descriptions):
+        text = '. '.join(rng.choice(SAMPLE_DESCRIPTION_SENTENCES).format(*rng.sample(names, 3))
+                         for _ in range(sentences))
+        phrases.append(extract_skill_phrases(text.lower()))
+    substring_matcher = build_skill_matcher('substring')
+    word_matcher = build_skill_matcher('word')
+    matchers = [
+        ('nested loops', nested_loops),
+        ('substring', lambda found: {c: substring_matcher.match_phrases(p) for c, p in found.items()}),
+        ('word boundary', lambda found: {c: word_matcher.match_phrases(p) for c, p in found.items()}),
+    ]
+    print(f"{len(phrases)} descriptions, {sum(len(p) for f in phrases for p in f.values())} phrases")
+    print(f"{'matcher':<16}{'ms/description':>16}{'speedup':>10}")
+    results = {}
+    baseline = None
+    for name, match in matchers:
+        start = time.perf_counter()
+        results[name] = [match(found) for found in phrases]
+        elapsed = (time.perf_counter() - start) / len(phrases) * 1000
+        baseline = baseline or elapsed
+        print(f"{name:<16}{elapsed:>16.2f}{baseline / elapsed:>9.1f}x")
+    if results['substring'] != results['nested loops']:
+        print('Warning: substring mode differs from the nested loops')
+
 def extract_text_from_file(file_path):
     """Extract text from different file formats."""
     file_ext = file_path.split('.')[-1].lower()
@@ -1246,96 +3099,229 @@ def extract_text_from_file(file_path):
         print(f"Error extracting text from file: {str(e)}")
         return ''
 
-def extract_skills_from_text(text):
-    """Extract skills from text using NLP and keyword matching."""
+def extract_skills_from_text(text, with_entities=True):
+    """Extract skills from text using NLP and keyword matching.
+
+    Returns (skills by context, ORG/PRODUCT entities). Callers that ignore
+    the entities pass with_entities=False to skip spaCy, and get [].
+    """
     # Convert text to lowercase
     text = text.lower()
     
     # Extract named entities using spaCy
-    doc = nlp(text)
-    entities = [ent.text.lower() for ent in doc.ents if ent.label_ in ['ORG', 'PRODUCT']]
-    
-    # Initialize skills dictionary
-    found_skills = {
-        'requirements': set(),
-        'experience': set(),
-        'responsibilities': set()
-    }
-    
-    # Extract skills using context-based patterns
-    skill_patterns = {
-        'requirements': [
-            r'required (?:skills|experience|knowledge) (?:in|with|of) ([^.,]+)',
-            r'must have (?:experience|knowledge) (?:in|with|of) ([^.,]+)',
-            r'should have (?:experience|knowledge) (?:in|with|of) ([^.,]+)',
-            r'looking for (?:experience|knowledge) (?:in|with|of) ([^.,]+)',
-            r'seeking (?:experience|knowledge) (?:in|with|of) ([^.,]+)',
-            r'candidates should have (?:experience|knowledge) (?:in|with|of) ([^.,]+)'
-        ],
-        'experience': [
-            r'experience (?:with|in|of) ([^.,]+)',
-            r'familiar (?:with|in) ([^.,]+)',
-            r'knowledge (?:of|in) ([^.,]+)',
-            r'proficient (?:in|with) ([^.,]+)',
-            r'expertise (?:in|with) ([^.,]+)',
-            r'working (?:with|in) ([^.,]+)',
-            r'using ([^.,]+)',
-            r'([^.,]+) experience',
-            r'([^.,]+) knowledge',
-            r'([^.,]+) skills',
-            r'([^.,]+) development',
-            r'([^.,]+) programming',
-            r'([^.,]+) systems',
-            r'([^.,]+) products',
-            r'([^.,]+) applications',
-            r'([^.,]+) technology'
-        ],
-        'responsibilities': [
-            r'responsible for ([^.,]+)',
-            r'managing ([^.,]+)',
-            r'developing ([^.,]+)',
-            r'creating ([^.,]+)',
-            r'building ([^.,]+)',
-            r'designing ([^.,]+)',
-            r'implementing ([^.,]+)',
-            r'maintaining ([^.,]+)'
-        ]
-    }
-    
-    # Extract skills using patterns
-    for context, patterns in skill_patterns.items():
-        for pattern in patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                skill = match.group(1).strip()
-                # Clean up the skill text
-                skill = re.sub(r'\b(?:and|or|with|in|of)\b', '', skill).strip()
-                if len(skill) > 2:  # Avoid single words or very short phrases
-                    found_skills[context].add(skill)
-    
-    # Match extracted skills against known technical skills
-    matched_skills = {
-        'requirements': set(),
-        'experience': set(),
-        'responsibilities': set()
-    }
-    
-    for category, skills in TECHNICAL_SKILLS.items():
-        for skill in skills:
-            skill_lower = skill.lower()
-            for context in found_skills:
-                for extracted_skill in found_skills[context]:
-                    if (skill_lower in extracted_skill.lower() or 
-                        extracted_skill.lower() in skill_lower):
-                        matched_skills[context].add(skill)
+    entities = doc_entities(get_nlp()(text)) if with_entities else []
     
-    # Convert sets to lists
-    return {k: list(v) for k, v in matched_skills.items()}, entities
+    return match_text_skills(text), entities
+
+def extract_skills_batch(texts, with_entities=True, batch_size=NLP_BATCH_SIZE, n_process=NLP_PROCESSES):
+    """extract_skills_from_text for many texts, with entities found through nlp.pipe.
+
+    `batch_size` texts go through spaCy at a time, on `n_process` processes.
+    Returns a list of (skills, entities) pairs in the order of `texts`.
+    """
+    texts = [text.lower() for text in texts]
+    if with_entities:
+        docs = get_nlp().pipe(texts, batch_size=batch_size, n_process=n_process)
+        entities = [doc_entities(doc) for doc in docs]
+    else:
+        entities = [[] for _ in texts]
+    return [(match_text_skills(text), ents) for text, ents in zip(texts, entities)]
+
+def match_text_skills(text):
+    """Return the known skills in lowercased `text`, as lists by context."""
+    # Match extracted phrases against known technical skills
+    found_skills = extract_skill_phrases(text)
+    return {context: list(skill_matcher.match_phrases(phrases)) for context, phrases in found_skills.items()}
+
+# Context patterns for candidate skill phrases. A phrase is the rest of a clause
+# after a prefix pattern or the start of a clause before a suffix pattern;
+# clauses end at '.' or ','.
+SKILL_PHRASE = '([^.,]+)'
+SKILL_PATTERNS = {
+    'requirements': [
+        r'required (?:skills|experience|knowledge) (?:in|with|of) ([^.,]+)',
+        r'must have (?:experience|knowledge) (?:in|with|of) ([^.,]+)',
+        r'should have (?:experience|knowledge) (?:in|with|of) ([^.,]+)',
+        r'looking for (?:experience|knowledge) (?:in|with|of) ([^.,]+)',
+        r'seeking (?:experience|knowledge) (?:in|with|of) ([^.,]+)',
+        r'candidates should have (?:experience|knowledge) (?:in|with|of) ([^.,]+)'
+    ],
+    'experience': [
+        r'experience (?:with|in|of) ([^.,]+)',
+        r'familiar (?:with|in) ([^.,]+)',
+        r'knowledge (?:of|in) ([^.,]+)',
+        r'proficient (?:in|with) ([^.,]+)',
+        r'expertise (?:in|with) ([^.,]+)',
+        r'working (?:with|in) ([^.,]+)',
+        r'using ([^.,]+)',
+        r'([^.,]+) experience',
+        r'([^.,]+) knowledge',
+        r'([^.,]+) skills',
+        r'([^.,]+) development',
+        r'([^.,]+) programming',
+        r'([^.,]+) systems',
+        r'([^.,]+) products',
+        r'([^.,]+) applications',
+        r'([^.,]+) technology'
+    ],
+    'responsibilities': [
+        r'responsible for ([^.,]+)',
+        r'managing ([^.,]+)',
+        r'developing ([^.,]+)',
+        r'creating ([^.,]+)',
+        r'building ([^.,]+)',
+        r'designing ([^.,]+)',
+        r'implementing ([^.,]+)',
+        r'maintaining ([^.,]+)'
+    ]
+}
+# Filler words removed from extracted phrases
+SKILL_FILLER_RE = re.compile(r'\b(?:and|or|with|in|of)\b')
+
+def compile_skill_patterns(patterns):
+    """Compile `patterns` into one regex that finds every pattern's anchor in a single scan.
+
+    Each pattern is split at SKILL_PHRASE into its literal anchor, a prefix
+    or a suffix. The regex matches, with zero width, at every clause end and
+    every position where some anchor starts, and sets the named group of
+    each anchor found there. Returns (regex, {group: (context, is_prefix)}).
+    """
+    anchors = {}
+    for context, context_patterns in patterns.items():
+        for i, pattern in enumerate(context_patterns):
+            before, phrase, after = pattern.partition(SKILL_PHRASE)
+            if not phrase or (before and after) or not (before or after):
+                raise ValueError(f"Skill pattern {pattern!r} must start or end with {SKILL_PHRASE}")
+            anchors[f'{context}_{i}'] = (context, bool(before), before or after)
+    gate = '|'.join([r'[.,]'] + [anchor for _, _, anchor in anchors.values()])
+    groups = ''.join(f'(?:(?=(?P<{name}>{anchor})))?' for name, (_, _, anchor) in anchors.items())
+    regex = re.compile(f'(?=(?:{gate}))(?:(?=(?P<clause_end>[.,])))?{groups}', re.IGNORECASE)
+    return regex, {name: (context, is_prefix) for name, (context, is_prefix, _) in anchors.items()}
+
+SKILL_ANCHORS_RE, SKILL_ANCHORS = compile_skill_patterns(SKILL_PATTERNS)
+
+def extract_skill_phrases(text):
+    """Return the candidate skill phrases in lowercased `text`, by context.
+
+    Finds the same phrases as running each of SKILL_PATTERNS with
+    re.finditer, from one scan of the text. Per clause, such a scan matches
+    a prefix pattern at its first occurrence, taking the rest of the clause,
+    and a suffix pattern at its last occurrence, taking the clause up to it.
+    """
+    found_skills = {context: set() for context in SKILL_PATTERNS}
+
+    def add(context, phrase):
+        phrase = SKILL_FILLER_RE.sub('', phrase.strip()).strip()
+        if len(phrase) > 2:  # Avoid single words or very short phrases
+            found_skills[context].add(phrase)
+
+    clause_start = 0
+    prefixes = {}  # group -> end of the pattern's first prefix in the clause
+    suffixes = {}  # group -> start of the pattern's last suffix in the clause
+
+    def close_clause(clause_end):
+        for name, end in prefixes.items():
+            if end < clause_end:
+                add(SKILL_ANCHORS[name][0], text[end:clause_end])
+        for name, start in suffixes.items():
+            if start > clause_start:
+                add(SKILL_ANCHORS[name][0], text[clause_start:start])
+        prefixes.clear()
+        suffixes.clear()
+
+    for match in SKILL_ANCHORS_RE.finditer(text):
+        if match.group('clause_end'):
+            close_clause(match.start())
+            clause_start = match.start() + 1
+            continue
+        for name, anchor in match.groupdict().items():
+            if anchor is None or name == 'clause_end':
+                continue
+            if SKILL_ANCHORS[name][1]:
+                prefixes.setdefault(name, match.start() + len(anchor))
+            else:
+                suffixes[name] = match.start()
+    close_clause(len(text))
+    return found_skills
+
+def verify_skill_patterns(corpus_path=SKILL_CORPUS):
+    """Check extract_skill_phrases against the phrases recorded in the regression corpus.
+
+    The corpus holds texts with the phrases the per-pattern finditer
+    extraction produced for them. Prints each text whose phrases differ and
+    returns True if none do.
+    """
+    with open(corpus_path, encoding='utf-8') as f:
+        corpus = json.load(f)
+    failures = 0
+    start = time.perf_counter()
+    for i, case in enumerate(corpus):
+        phrases = {context: sorted(found) for context, found in extract_skill_phrases(case['text'].lower()).items()}
+        if phrases != case['phrases']:
+            failures += 1
+            print(f"Case {i} differs: {case['text'][:60]!r}")
+            for context, expected in case['phrases'].items():
+                missing = set(expected) - set(phrases[context])
+                extra = set(phrases[context]) - set(expected)
+                if missing or extra:
+                    print(f"  {context}: missing {sorted(missing)}, extra {sorted(extra)}")
+    elapsed = time.perf_counter() - start
+    print(f"{len(corpus) - failures}/{len(corpus)} corpus texts match ({elapsed * 1000:.1f}ms)")
+    return failures == 0
+
+# RESUME PROFILE
+def store_resume_profile(conn, file_path):
+    """Extract and cache the skill profile of a resume file; return its content hash.
+
+    Profiles are keyed by the SHA-256 of the file, so uploading the same
+    resume again reuses the stored profile. Profiles made by an older
+    SKILL_PROFILE_VERSION are recomputed. The caller commits.
+    """
+    with open(file_path, 'rb') as f:
+        content_hash = hashlib.sha256(f.read()).hexdigest()
+    cached = conn.execute('SELECT version FROM resume_profiles WHERE content_hash = ?',
+                          (content_hash,)).fetchone()
+    if cached and cached['version'] == SKILL_PROFILE_VERSION:
+        return content_hash
+    skills, entities = extract_skills_from_text(extract_text_from_file(file_path))
+    conn.execute('''
+        INSERT OR REPLACE INTO resume_profiles (content_hash, version, skills, entities, created_at)
+        VALUES (?,?,?,?,?)
+    ''', (content_hash, SKILL_PROFILE_VERSION, json.dumps(skills), json.dumps(entities), time.time()))
+    return content_hash
+
+def get_resume_profile(conn):
+    """Return (content_hash, skills by context) of the latest resume, or (None, {}).
+
+    Reads the cached profile. A resume uploaded before profiles existed, or
+    whose profile is out of date, is profiled once here.
+    """
+    resume = conn.execute('''
+        SELECT r.id, r.filename, r.content_hash, p.version, p.skills
+        FROM resume r LEFT JOIN resume_profiles p ON p.content_hash = r.content_hash
+        ORDER BY r.uploaded_at DESC LIMIT 1
+    ''').fetchone()
+    if not resume:
+        return None, {}
+    if resume['version'] == SKILL_PROFILE_VERSION:
+        return resume['content_hash'], json.loads(resume['skills'])
+    resume_path = os.path.join(app.config['UPLOAD_FOLDER'], resume['filename'])
+    if not os.path.exists(resume_path):
+        return None, {}
+    content_hash = store_resume_profile(conn, resume_path)
+    conn.execute('UPDATE resume SET content_hash = ? WHERE id = ?', (content_hash, resume['id']))
+    conn.commit()
+    return content_hash, json.loads(conn.execute('SELECT skills FROM resume_profiles WHERE content_hash = ?',
+                                                 (content_hash,)).fetchone()['skills'])
+
+def get_resume_skills(conn):
+    """Return the skills of the latest resume, by context, or {} if there is none."""
+    return get_resume_profile(conn)[1]
 
 def calculate_job_match(job_description, resume_skills):
     """Calculate job match percentage based on skills and requirements."""
     # Extract skills from job description
-    job_skills, _ = extract_skills_from_text(job_description)
+    job_skills, _ = extract_skills_from_text(job_description, with_entities=False)
     
     # Calculate match score
     total_skills = 0
@@ -1343,11 +3329,7 @@ def calculate_job_match(job_description, resume_skills):
     missing_skills = {}
     
     # Weight different contexts differently
-    context_weights = {
-        'requirements': 1.5,  # Required skills are most important
-        'experience': 1.3,    # Experience is second most important
-        'responsibilities': 1.0  # Responsibilities are least important
-    }
+    context_weights = SKILL_CONTEXT_WEIGHTS
     
     for context, skills in job_skills.items():
         weight = context_weights.get(context, 1.0)
@@ -1396,12 +3378,149 @@ def calculate_job_match(job_description, resume_skills):
     
     return match_percentage, matched_skills, missing_skills
 
+# BATCH MATCH SCORING
+def skills_related(a, b):
+    """True if two skills match the way calculate_job_match compares them."""
+    a, b = a.lower(), b.lower()
+    return a == b or a in b or b in a
+
+# Column of each known skill in the job skill matrices
+SKILL_VOCABULARY = sorted(set(SKILL_CATEGORIES) | set(SKILL_ALIASES.values()))
+SKILL_INDEX = {skill: i for i, skill in enumerate(SKILL_VOCABULARY)}
+# SKILL_RELATIONS[i, j] is 1 if skills i and j are related, so a resume vector
+# times it marks every job skill the resume covers
+SKILL_RELATIONS = sparse.csr_matrix(np.array(
+    [[skills_related(a, b) for b in SKILL_VOCABULARY] for a in SKILL_VOCABULARY], dtype=np.float64))
+
+def job_skill_matrix(job_skills):
+    """Sparse jobs x SKILL_VOCABULARY matrix of context weights.
+
+    Cell (i, j) sums SKILL_CONTEXT_WEIGHTS over the contexts where job i
+    lists skill j, so row sums are calculate_job_match's weighted totals.
+    """
+    rows, cols, weights = [], [], []
+    for i, skills in enumerate(job_skills):
+        for context, context_skills in skills.items():
+            weight = SKILL_CONTEXT_WEIGHTS.get(context, 1.0)
+            for skill in context_skills:
+                if skill in SKILL_INDEX:
+                    rows.append(i)
+                    cols.append(SKILL_INDEX[skill])
+                    weights.append(weight)
+    return sparse.csr_matrix((weights, (rows, cols)), shape=(len(job_skills), len(SKILL_VOCABULARY)),
+                             dtype=np.float64)
+
+def batch_match_percentages(job_skills, resume_skills):
+    """calculate_job_match's percentage for many jobs at once.
+
+    Marks the skills the resume covers with one product against
+    SKILL_RELATIONS, then scores every job with one sparse matrix-vector
+    product: the covered weight of each row over its total weight.
+    """
+    resume_vector = np.zeros(len(SKILL_VOCABULARY))
+    for context_skills in resume_skills.values():
+        for skill in context_skills:
+            if skill in SKILL_INDEX:
+                resume_vector[SKILL_INDEX[skill]] = 1
+    covered = (SKILL_RELATIONS @ resume_vector > 0).astype(np.float64)
+    matrix = job_skill_matrix(job_skills)
+    totals = np.asarray(matrix.sum(axis=1)).ravel()
+    matched = matrix @ covered
+    return np.divide(matched, totals, out=np.zeros_like(totals), where=totals > 0) * 100
+
+def score_jobs(conn, job_ids):
+    """Score jobs against the latest resume and store the results in jobs.
+
+    Skills are extracted only for jobs without a current skills profile, in
+    batches through extract_skills_batch, and saved for later rescoring.
+    Scores go to match_value and match_score, and match_profile records the
+    resume they are for. Jobs still waiting for their details page keep
+    match_score 'N/A' until the description arrives. Does nothing without a
+    resume. Returns the number of jobs scored.
+    """
+    content_hash, resume_skills = get_resume_profile(conn)
+    if not content_hash:
+        return 0
+    profile = f'{content_hash}:{SKILL_PROFILE_VERSION}'
+    job_ids = list(job_ids)
+    scored = 0
+    for i in range(0, len(job_ids), SCORE_CHUNK_SIZE):
+        chunk = job_ids[i:i + SCORE_CHUNK_SIZE]
+        # Same test as needs_details(); NULL descriptions fail NOT IN as well
+        rows = conn.execute(f'''
+            SELECT id, description, skills, skills_version FROM jobs
+            WHERE id IN ({','.join('?' * len(chunk))}) AND description NOT IN ('', ?)
+        ''', chunk + [DETAILS_PLACEHOLDER]).fetchall()
+        if not rows:
+            continue
+        stale = [row for row in rows if row['skills_version'] != SKILL_PROFILE_VERSION]
+        extracted = extract_skills_batch([row['description'] or '' for row in stale], with_entities=False)
+        skills = {row['id']: json.loads(row['skills']) for row in rows
+                  if row['skills_version'] == SKILL_PROFILE_VERSION}
+        skills.update((row['id'], job_skills) for row, (job_skills, _) in zip(stale, extracted))
+        ids = [row['id'] for row in rows]
+        percentages = batch_match_percentages([skills[job_id] for job_id in ids], resume_skills)
+        conn.executemany('UPDATE jobs SET skills = ?, skills_version = ? WHERE id = ?',
+                         [(json.dumps(skills[row['id']]), SKILL_PROFILE_VERSION, row['id']) for row in stale])
+        updates = []
+        for job_id, percentage in zip(ids, percentages):
+            match_value = round(float(percentage), 1)
+            updates.append((match_value, f"{match_value}%", profile, job_id))
+        conn.executemany('UPDATE jobs SET match_value = ?, match_score = ?, match_profile = ? WHERE id = ?',
+                         updates)
+        conn.commit()
+        scored += len(rows)
+    return scored
+
+def score_search_results(conn, source, where, params):
+    """Score up to SEARCH_MAX_RESULTS of the jobs a search matches that have no current score.
+
+    Ingestion scores new jobs and rescore_jobs_in_background rescores the
+    rest after a resume upload, so the cap only bites while that runs.
+    """
+    content_hash, _ = get_resume_profile(conn)
+    if not content_hash:
+        return 0
+    rows = conn.execute(f'''
+        SELECT jobs.id FROM {source}
+        WHERE {where} AND jobs.match_profile IS NOT ? AND jobs.description NOT IN ('', ?)
+        LIMIT ?
+    ''', params + [f'{content_hash}:{SKILL_PROFILE_VERSION}', DETAILS_PLACEHOLDER, SEARCH_MAX_RESULTS]).fetchall()
+    return score_jobs(conn, [row[0] for row in rows])
+
+# Rescores after a resume upload, one at a time, off the request thread
+score_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='score')
+
+def rescore_stale_jobs():
+    """Score every job whose match score is not for the current resume."""
+    conn = get_conn()
+    try:
+        content_hash, _ = get_resume_profile(conn)
+        if not content_hash:
+            return 0
+        rows = conn.execute('''
+            SELECT id FROM jobs
+            WHERE dedup_key IS NOT NULL AND match_profile IS NOT ? AND description NOT IN ('', ?)
+        ''', (f'{content_hash}:{SKILL_PROFILE_VERSION}', DETAILS_PLACEHOLDER)).fetchall()
+        scored = score_jobs(conn, [row[0] for row in rows])
+    except Exception as e:
+        print(f"Error rescoring jobs: {str(e)}")
+        return 0
+    finally:
+        conn.close()
+    print(f"Rescored {scored} jobs against the new resume")
+    return scored
+
+def rescore_jobs_in_background():
+    return score_executor.submit(rescore_stale_jobs)
+
 def generate_personalized_suggestions(job_requirements, resume_skills, resume_text):
     """Generate personalized suggestions based on job requirements and resume content."""
     suggestions = []
     
     # Extract skills from job description
-    job_skills, _ = extract_skills_from_text(job_requirements['context'].get('description', ''))
+    job_skills, _ = extract_skills_from_text(job_requirements['context'].get('description', ''),
+                                             with_entities=False)
     
     # Process each context
     for context, skills in job_skills.items():
@@ -1435,11 +3554,7 @@ def generate_personalized_suggestions(job_requirements, resume_skills, resume_te
             # Add specific action items based on context and skill category
             for skill in missing_skills:
                 # Find the category of the skill
-                skill_category = None
-                for category, skills_list in TECHNICAL_SKILLS.items():
-                    if skill.lower() in [s.lower() for s in skills_list]:
-                        skill_category = category
-                        break
+                skill_category = SKILL_CATEGORIES.get(skill.lower())
                 
                 if skill_category:
                     if context == 'requirements':
@@ -1468,45 +3583,146 @@ def generate_personalized_suggestions(job_requirements, resume_skills, resume_te
     
     return suggestions
 
-def migrate_applications_table():
-    conn = get_conn()
-    c = conn.cursor()
-    # Add columns if they do not exist
-    try:
-        c.execute("ALTER TABLE applications ADD COLUMN company TEXT")
-    except Exception:
-        pass
-    try:
-        c.execute("ALTER TABLE applications ADD COLUMN location TEXT")
-    except Exception:
-        pass
-    try:
-        c.execute("ALTER TABLE applications ADD COLUMN referral TEXT")
-    except Exception:
-        pass
-    try:
-        c.execute("ALTER TABLE applications ADD COLUMN job_link TEXT")
-    except Exception:
-        pass
-    try:
-        c.execute("ALTER TABLE applications ADD COLUMN referral_mail TEXT")
-    except Exception:
-        pass
-    try:
-        c.execute("ALTER TABLE applications ADD COLUMN title TEXT")
-    except Exception:
-        pass
-    conn.commit()
-    conn.close()
-
 @app.route('/api/migrate-applications', methods=['POST'])
 def migrate_applications():
-    migrate_applications_table()
-    return jsonify({'status': 'success', 'message': 'Applications table migrated.'})
+    init_db()
+    return jsonify({'status': 'success', 'message': 'Database schema is up to date.',
+                    'schema_version': len(MIGRATIONS)})
+
+# APPLICATION IMPORTS
+def read_spreadsheet_chunks(path, chunk_rows=IMPORT_CHUNK_ROWS):
+    """Yield a spreadsheet as DataFrames of at most `chunk_rows` string-valued rows.
+
+    CSV files are read with pandas in chunks and .xlsx files row by row with
+    openpyxl in read-only mode, so memory stays flat however large the sheet
+    is. Legacy .xls files can only be read whole.
+    """
+    if path.endswith('.csv'):
+        yield from pd.read_csv(path, dtype=str, keep_default_na=False, chunksize=chunk_rows)
+        return
+    if not path.endswith('.xlsx') or openpyxl is None:
+        df = pd.read_excel(path, dtype=str).fillna('')
+        for start in range(0, len(df), chunk_rows):
+            yield df.iloc[start:start + chunk_rows]
+        return
+    workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+        header = ['' if value is None else str(value) for value in next(rows, ())]
+        width = len(header)
+        chunk = []
+        for row in rows:
+            # Pad or trim ragged rows to the header
+            chunk.append(tuple(row[:width]) + (None,) * (width - len(row)))
+            if len(chunk) == chunk_rows:
+                yield pd.DataFrame(chunk, columns=header)
+                chunk = []
+        if chunk:
+            yield pd.DataFrame(chunk, columns=header)
+    finally:
+        workbook.close()
+
+def map_import_columns(df):
+    """Rename spreadsheet headers to applications columns and clean every value."""
+    df = df.rename(columns=lambda name: IMPORT_COLUMNS.get(str(name).strip(), name))
+    df = df.reindex(columns=list(IMPORT_COLUMNS.values()))
+    return df.fillna('').astype(str).apply(lambda column: column.str.strip())
+
+class ApplicationImporter:
+    """Runs tracker spreadsheet imports in the background and tracks their progress.
+
+    Rows are staged chunk by chunk in a temporary table, then merged into
+    applications with one INSERT ... ON CONFLICT (job_link) DO UPDATE, all in
+    one transaction. Rows without a link are always added. Progress of the
+    last `history` imports can be looked up by id.
+    """
+
+    def __init__(self, history=IMPORT_HISTORY):
+        self.history = history
+        self._imports = OrderedDict()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='import')
+
+    def start(self, path):
+        import_id = uuid.uuid4().hex
+        with self._lock:
+            self._imports[import_id] = {
+                'id': import_id,
+                'state': 'queued',
+                'rows_read': 0,
+                'rows_written': 0,
+                'error': None,
+                'started_at': time.time(),
+                'finished_at': None
+            }
+            while len(self._imports) > self.history:
+                self._imports.popitem(last=False)
+        self._executor.submit(self._run, import_id, path)
+        return import_id
+
+    def progress(self, import_id):
+        with self._lock:
+            entry = self._imports.get(import_id)
+            return dict(entry) if entry else None
+
+    def _update(self, import_id, **fields):
+        with self._lock:
+            if import_id in self._imports:
+                self._imports[import_id].update(fields)
+
+    def _run(self, import_id, path):
+        conn = get_conn()
+        try:
+            self._update(import_id, state='reading')
+            conn.execute('''
+                CREATE TEMP TABLE IF NOT EXISTS applications_import (
+                    seq INTEGER PRIMARY KEY,
+                    company TEXT, location TEXT, referral TEXT,
+                    job_link TEXT, status TEXT, referral_mail TEXT
+                )
+            ''')
+            conn.execute('DELETE FROM applications_import')
+            rows_read = 0
+            for chunk in read_spreadsheet_chunks(path):
+                df = map_import_columns(chunk)
+                conn.executemany(
+                    '''INSERT INTO applications_import
+                       (company, location, referral, job_link, status, referral_mail)
+                       VALUES (?, ?, ?, ?, ?, ?)''',
+                    df.itertuples(index=False, name=None)
+                )
+                rows_read += len(df)
+                self._update(import_id, rows_read=rows_read)
+            self._update(import_id, state='writing')
+            # Staged in file order, so a link listed twice keeps its last row
+            written = conn.execute('''
+                INSERT INTO applications (company, location, referral, job_link, status, referral_mail)
+                SELECT company, location, referral, NULLIF(job_link, ''), status, referral_mail
+                FROM applications_import WHERE true ORDER BY seq
+                ON CONFLICT (job_link) DO UPDATE SET
+                    company = excluded.company,
+                    location = excluded.location,
+                    referral = excluded.referral,
+                    status = excluded.status,
+                    referral_mail = excluded.referral_mail
+            ''').rowcount
+            conn.execute('DELETE FROM applications_import')
+            conn.commit()
+            self._update(import_id, state='done', rows_written=written, finished_at=time.time())
+            print(f"Imported {written} applications from {path}")
+        except Exception as e:
+            print(f"Error importing applications: {str(e)}")
+            self._update(import_id, state='error', error=str(e), finished_at=time.time())
+        finally:
+            conn.close()
+            if os.path.exists(path):
+                os.remove(path)
+
+application_importer = ApplicationImporter()
 
 @app.route('/api/upload_applications_excel', methods=['POST'])
 def upload_applications_excel():
-    clear_applications_if_large()
+    """Start importing an uploaded tracker spreadsheet; poll /api/imports/<id> for progress."""
     if 'file' not in request.files:
         return jsonify({'status': 'error', 'message': 'No file uploaded'}), 400
     file = request.files['file']
@@ -1515,93 +3731,47 @@ def upload_applications_excel():
     if not allowed_excel_file(file.filename):
         return jsonify({'status': 'error', 'message': 'Invalid file type'}), 400
     try:
-        # Save file temporarily
-        filename = secure_filename(file.filename)
+        # Unique name, so concurrent uploads of the same file do not clash
+        filename = f"{uuid.uuid4().hex}-{secure_filename(file.filename)}"
         temp_path = os.path.join(UPLOAD_FOLDER, filename)
         file.save(temp_path)
-        # Read with pandas
-        if filename.endswith('.csv'):
-            df = pd.read_csv(temp_path)
-        else:
-            df = pd.read_excel(temp_path)
-        # Clean up temp file
-        os.remove(temp_path)
-        # Map columns
-        col_map = {
-            'Company': 'company',
-            'Location': 'location',
-            'Referral': 'referral',
-            'Link': 'job_link',
-            'Status': 'status',
-            'Referral mail': 'referral_mail',
-        }
-        df = df.rename(columns=col_map)
-        # Upsert each row
-        conn = get_conn()
-        c = conn.cursor()
-        for _, row in df.iterrows():
-            company = str(row.get('company', '')).strip()
-            location = str(row.get('location', '')).strip()
-            referral = str(row.get('referral', '')).strip()
-            job_link = str(row.get('job_link', '')).strip()
-            status = str(row.get('status', '')).strip()
-            referral_mail = str(row.get('referral_mail', '')).strip()
-            if job_link:
-                # First try to update existing record
-                c.execute('''UPDATE applications 
-                           SET company=?, location=?, referral=?, status=?, referral_mail=?
-                           WHERE job_link=?''',
-                        (company, location, referral, status, referral_mail, job_link))
-                # If no record was updated, insert new one
-                if c.rowcount == 0:
-                    c.execute('''INSERT INTO applications 
-                               (company, location, referral, job_link, status, referral_mail)
-                               VALUES (?, ?, ?, ?, ?, ?)''',
-                            (company, location, referral, job_link, status, referral_mail))
-            else:
-                # If no job_link, just insert as new record
-                c.execute('''INSERT INTO applications 
-                           (company, location, referral, status, referral_mail)
-                           VALUES (?, ?, ?, ?, ?)''',
-                        (company, location, referral, status, referral_mail))
-        conn.commit()
-        conn.close()
-        return jsonify({'status': 'success', 'message': 'Applications uploaded and updated.'})
+        import_id = application_importer.start(temp_path)
+        return jsonify({'status': 'accepted', 'import_id': import_id,
+                        'progress': application_importer.progress(import_id)}), 202
     except Exception as e:
         print(f"Error uploading applications Excel: {str(e)}")
         return jsonify({'status': 'error', 'message': str(e)}), 500
 
-# Add this utility function near the top, after get_conn()
-def clear_applications_if_large(threshold=200):
-    conn = get_conn()
-    count = conn.execute('SELECT COUNT(*) FROM applications').fetchone()[0]
-    if count > threshold:
-        print(f"Clearing applications table (had {count} rows)")
-        conn.execute('DELETE FROM applications')
-        conn.commit()
-    conn.close()
-
-# Call this at app startup
-clear_applications_if_large()
+@app.route('/api/imports/<import_id>', methods=['GET'])
+def import_progress(import_id):
+    progress = application_importer.progress(import_id)
+    if not progress:
+        return jsonify({'status': 'error', 'message': 'Unknown import'}), 404
+    return jsonify(progress)
 
 if __name__ == '__main__':
     import sys
     if len(sys.argv) > 1 and sys.argv[1] == 'init-db':
         init_db()
         print('Database initialized successfully!')
+    elif len(sys.argv) > 1 and sys.argv[1] == 'bench-parsers':
+        benchmark_parsers(*sys.argv[2:3])
+    elif len(sys.argv) > 1 and sys.argv[1] == 'bench-search':
+        benchmark_search(*sys.argv[2:4])
+    elif len(sys.argv) > 1 and sys.argv[1] == 'bench-skills':
+        benchmark_skills()
+    elif len(sys.argv) > 1 and sys.argv[1] == 'verify-skills':
+        sys.exit(0 if verify_skill_patterns(*sys.argv[2:3]) else 1)
+    elif len(sys.argv) > 1 and sys.argv[1] == 'ingest':
+        # Run the ingestion scheduler on its own, e.g. with INGEST_ENABLED=0 in the web app
+        ingestion_scheduler.start()
+        ingestion_scheduler.join()
     else:
         # Download required NLTK data
         nltk.download('stopwords')
         nltk.download('punkt')
         nltk.download('averaged_perceptron_tagger')
         nltk.download('wordnet')
-        # Load spaCy model
-        try:
-            nlp = spacy.load('en_core_web_sm')
-        except OSError:
-            print("Downloading spaCy model...")
-            spacy.cli.download('en_core_web_sm')
-            nlp = spacy.load('en_core_web_sm')
         # Create uploads directory if it doesn't exist
         os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
         # Run the app
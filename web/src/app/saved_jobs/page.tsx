@@ -36,15 +36,19 @@ export default function SavedJobsPage() {
   const [appliedJobs, setAppliedJobs] = useState<{[id: number]: boolean}>({});
   const [page, setPage] = useState(1);
   const [totalPages, setTotalPages] = useState(1);
+  // Cursor that fetches each page reached with "next"; other pages are requested by number
+  const [cursors, setCursors] = useState<{[page: number]: string}>({});
 
   useEffect(() => {
     async function fetchJobs() {
       setLoading(true);
       const params = new URLSearchParams({ page: String(page) });
+      if (cursors[page]) params.set('cursor', cursors[page]);
       const res = await fetch(`${API_BASE_URL}/api/saved_jobs?${params.toString()}`);
       const data = await res.json();
       setJobs(data.saved_jobs || []);
       setTotalPages(data.pages || 1);
+      if (data.cursor) setCursors(c => ({ ...c, [page + 1]: data.cursor }));
       setLoading(false);
     }
     fetchJobs();
@@ -68,6 +68,7 @@ export default function SearchPage() {
   const [modalJob, setModalJob] = useState<Job | null>(null);
   const [page, setPage] = useState(1);
   const [totalPages, setTotalPages] = useState(1);
+  const [snapshot, setSnapshot] = useState('');
   const [locations, setLocations] = useState<string[]>([]);
   const [platforms, setPlatforms] = useState<string[]>([]);
   const [selectedLocation, setSelectedLocation] = useState('');
@@ -135,7 +136,7 @@ export default function SearchPage() {
     return () => window.removeEventListener('focus', syncJobStatusUpdates);
   }, []);
 
-  const handleSearch = async (e?: React.FormEvent, pageOverride?: number) => {
+  const handleSearch = async (e?: React.FormEvent, pageOverride?: number, snapshotId?: string) => {
     if (e) e.preventDefault();
     setLoading(true);
     const params = new URLSearchParams({
@@ -146,10 +147,13 @@ export default function SearchPage() {
       sort_by: sortBy,
       sort_order: sortOrder
     });
+    // Page through the existing result snapshot instead of searching again
+    if (snapshotId) params.set('snapshot', snapshotId);
     const res = await fetch(`${API_BASE_URL}/api/search?${params.toString()}`);
     const data = await res.json();
     setJobs(data.jobs || []);
     setTotalPages(data.pages || 1);
+    setSnapshot(data.snapshot || '');
     setLoading(false);
     // After search, fetch applied statuses
     try {
@@ -165,7 +169,7 @@ export default function SearchPage() {
 
   const handlePageChange = (_: unknown, value: number) => {
     setPage(value);
-    handleSearch(undefined, value);
+    handleSearch(undefined, value, snapshot);
   };
 
   const handleDetails = async (jobId: number) => {
@@ -345,6 +349,7 @@ export default function SearchPage() {
                   <option value="location-desc">Location (Z-A)</option>
                   <option value="match_score-desc">Match Score (Highest First)</option>
                   <option value="match_score-asc">Match Score (Lowest First)</option>
+                  <option value="relevance-desc">Relevance (Best Match First)</option>
                 </select>
               </div>
             </div>
@@ -25,14 +25,19 @@ export default function TrackerPage() {
   const [statusMsg, setStatusMsg] = useState<{[id: number]: string}>({});
   const [fileUploading, setFileUploading] = useState(false);
   const [fileUploadMsg, setFileUploadMsg] = useState<string | null>(null);
+  const [page, setPage] = useState(1);
+  const [pages, setPages] = useState(0);
+  const [statusFilter, setStatusFilter] = useState('Applied');
+  const [statusCounts, setStatusCounts] = useState<{[status: string]: number}>({});
 
   useEffect(() => {
     async function fetchApps() {
       setLoading(true);
       setError(null);
       try {
-        console.log('Fetching applications from:', `${API_BASE_URL}/api/tracker`);
-        const res = await fetch(`${API_BASE_URL}/api/tracker`);
+        const params = new URLSearchParams({ page: String(page), status: statusFilter });
+        console.log('Fetching applications from:', `${API_BASE_URL}/api/tracker?${params}`);
+        const res = await fetch(`${API_BASE_URL}/api/tracker?${params}`);
         console.log('Response status:', res.status);
         if (!res.ok) {
           throw new Error(`API error: ${res.status}`);
@@ -43,6 +48,8 @@ export default function TrackerPage() {
           throw new Error(data.error);
         }
         setApps(data.applications || []);
+        setPages(data.pages || 0);
+        setStatusCounts(data.status_counts || {});
       } catch (err) {
         console.error('Error fetching applications:', err);
         setError('Failed to load applications. Please try again later.');
@@ -52,7 +59,7 @@ export default function TrackerPage() {
       }
     }
     fetchApps();
-  }, []);
+  }, [page, statusFilter]);
 
   const handleFileUpload = async (e: React.ChangeEvent<HTMLInputElement>) => {
     if (!e.target.files || e.target.files.length === 0) return;
@@ -69,12 +76,24 @@ export default function TrackerPage() {
       console.log('Upload response status:', res.status);
       const data = await res.json();
       console.log('Upload response data:', data);
-      if (data.status === 'success') {
-        setFileUploadMsg('Applications uploaded and updated!');
+      if (data.status !== 'accepted') {
+        setFileUploadMsg('Error: ' + (data.message || 'Upload failed.'));
+        return;
+      }
+      // The import runs in the background; poll its progress until it finishes
+      let progress = data.progress;
+      while (progress.state !== 'done' && progress.state !== 'error') {
+        setFileUploadMsg(`Importing... ${progress.rows_read} rows read`);
+        await new Promise(resolve => setTimeout(resolve, 500));
+        const progressRes = await fetch(`${API_BASE_URL}/api/imports/${data.import_id}`);
+        progress = await progressRes.json();
+      }
+      if (progress.state === 'done') {
+        setFileUploadMsg(`Applications uploaded and updated! (${progress.rows_written} rows)`);
         // Refresh tracker
         window.location.reload();
       } else {
-        setFileUploadMsg('Error: ' + (data.message || 'Upload failed.'));
+        setFileUploadMsg('Error: ' + (progress.error || 'Upload failed.'));
       }
     } catch (err) {
       console.error('Error uploading file:', err);
@@ -116,15 +135,15 @@ export default function TrackerPage() {
     }
   };
 
-  // Add status counts
-  const statusCounts = apps.reduce((acc, app) => {
-    const status = (app.status || '').toLowerCase();
-    if (status === 'applied') acc.applied += 1;
-    else if (status === 'rejected') acc.rejected += 1;
-    else if (status === 'interview') acc.interview += 1;
-    else if (status === 'congrats') acc.congrats += 1;
-    return acc;
-  }, { applied: 0, rejected: 0, interview: 0, congrats: 0 });
+  // Status counts over all applications come from the server, not the current page
+  const countStatus = (status: string) => Object.entries(statusCounts)
+    .filter(([s]) => s.toLowerCase() === status)
+    .reduce((total, [, count]) => total + count, 0);
+
+  const handleStatusFilter = (status: string) => {
+    setStatusFilter(status);
+    setPage(1);
+  };
 
   return (
     <div className="container-fluid py-4">
@@ -133,10 +152,10 @@ export default function TrackerPage() {
           <h2 className="display-5 mb-4 text-primary">Application Tracker</h2>
           {/* Status Counters */}
           <div className="mb-3 d-flex gap-4">
-            <span className="badge bg-primary">Applied: {statusCounts.applied}</span>
-            <span className="badge bg-danger">Rejected: {statusCounts.rejected}</span>
-            <span className="badge bg-warning text-dark">Interview: {statusCounts.interview}</span>
-            <span className="badge bg-success">Congrats: {statusCounts.congrats}</span>
+            <span className="badge bg-primary">Applied: {countStatus('applied')}</span>
+            <span className="badge bg-danger">Rejected: {countStatus('rejected')}</span>
+            <span className="badge bg-warning text-dark">Interview: {countStatus('interview')}</span>
+            <span className="badge bg-success">Congrats: {countStatus('congrats')}</span>
           </div>
           <div className="card shadow-sm mb-4">
             <div className="card-body">
@@ -145,6 +164,19 @@ export default function TrackerPage() {
                 <input type="file" accept=".xlsx,.xls,.csv" onChange={handleFileUpload} disabled={fileUploading} />
                 {fileUploading && <span className="text-muted ms-2">Uploading...</span>}
                 {fileUploadMsg && <span className="ms-2 text-success">{fileUploadMsg}</span>}
+                <label className="form-label mb-0 ms-auto">Status:</label>
+                <select
+                  className="form-select form-select-sm"
+                  style={{ width: 140 }}
+                  value={statusFilter}
+                  onChange={e => handleStatusFilter(e.target.value)}
+                >
+                  <option value="all">All</option>
+                  <option value="Applied">Applied</option>
+                  <option value="Rejected">Rejected</option>
+                  <option value="Interview">Interview</option>
+                  <option value="Congrats">Congrats</option>
+                </select>
               </div>
               {(() => { console.log('Loading:', loading, 'Apps:', apps); return null; })()}
               {loading ? (
@@ -224,6 +256,17 @@ export default function TrackerPage() {
                       ))}
                     </tbody>
                   </table>
+                  {pages > 1 && (
+                    <div className="d-flex justify-content-center align-items-center gap-3">
+                      <button className="btn btn-outline-primary btn-sm" disabled={page <= 1} onClick={() => setPage(page - 1)}>
+                        Previous
+                      </button>
+                      <span>Page {page} of {pages}</span>
+                      <button className="btn btn-outline-primary btn-sm" disabled={page >= pages} onClick={() => setPage(page + 1)}>
+                        Next
+                      </button>
+                    </div>
+                  )}
                 </div>
               )}
             </div>